@@ -692,8 +692,8 @@ async def health_check() -> dict:
         github_status = "connected"
         try:
             client = GitHubClient()
-            # Faz uma requisição simples para testar
-            await client._make_request("/rate_limit")
+            # Faz uma requisição simples para testar, sem novas tentativas
+            await client._make_request("/rate_limit", ttl=0, max_attempts=1)
         except Exception as e:
             github_status = f"error: {str(e)[:50]}"
             logger.warning(f"GitHub API não acessível: {e}")
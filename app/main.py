@@ -4,17 +4,29 @@ Aplicação principal da GitHub Data API
 
 import time
 import uuid
+import orjson
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api.routes import router
+from app.services.github_client import close_http_client
 from app.utils.logger import logger, log_request, setup_logging
 
 # Configuração de logging
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ciclo de vida da aplicação: fecha o pool HTTP do GitHub no desligamento"""
+    yield
+    await close_http_client()
+
+
 # Criação da aplicação FastAPI
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.api_title,
     version=settings.api_version,
     description="""
@@ -149,6 +161,15 @@ app.add_middleware(
 # Inclusão das rotas
 app.include_router(router)
 
+# Corpo JSON da rota raiz
+ROOT_CONTENT = orjson.dumps({
+    "message": "Bem-vindo à GitHub Data API",
+    "version": settings.api_version,
+    "description": settings.api_description,
+    "docs": "/docs",
+    "health": "/api/v1/health"
+})
+
 # Rota raiz
 @app.get("/", summary="Página inicial")
 async def root():
@@ -158,13 +179,7 @@ async def root():
     Returns:
         Informações sobre a API
     """
-    return {
-        "message": "Bem-vindo à GitHub Data API",
-        "version": settings.api_version,
-        "description": settings.api_description,
-        "docs": "/docs",
-        "health": "/api/v1/health"
-    }
+    return Response(content=ROOT_CONTENT, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -4,18 +4,30 @@ Serviço de cache para a API
 
 import json
 import hashlib
+import time
 from typing import Any, Optional, Union
 from datetime import datetime, timedelta
-from cachetools import TTLCache
+from cachetools import TLRUCache
 import redis
 from app.config import settings
 
 
+def _now() -> float:
+    """Relógio usado para expirar as entradas do cache em memória"""
+    return time.time()
+
+
+def _entry_expiration(key: str, entry: tuple, now: float) -> float:
+    """Expira cada entrada em memória de acordo com o TTL guardado junto dela"""
+    return now + entry[0]
+
+
 class CacheService:
     """Serviço de cache com suporte a cache em memória e Redis"""
     
     def __init__(self):
-        self.memory_cache = TTLCache(maxsize=1000, ttl=300)  # 5 minutos por padrão
+        # Entradas guardadas como (ttl, valor), para respeitar o ttl de cada set()
+        self.memory_cache = TLRUCache(maxsize=1000, ttu=_entry_expiration, timer=_now)
         self.redis_client = None
         self.use_redis = settings.use_redis_cache
         
@@ -68,7 +80,8 @@ class CacheService:
                     return json.loads(value)
             
             # Fallback para cache em memória
-            return self.memory_cache.get(key)
+            entry = self.memory_cache.get(key)
+            return entry[1] if entry is not None else None
             
         except Exception as e:
             print(f"⚠️  Erro ao obter cache: {e}")
@@ -83,7 +96,7 @@ class CacheService:
                 return self.redis_client.setex(key, ttl, serialized_value)
             
             # Fallback para cache em memória
-            self.memory_cache[key] = value
+            self.memory_cache[key] = (ttl, value)
             return True
             
         except Exception as e:
@@ -2,8 +2,14 @@
 Cliente HTTP para a API do GitHub
 """
 
+import asyncio
+import random
+import time
 import httpx
-from typing import Optional, Dict, Any, List
+import orjson
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, AsyncIterator, Mapping
+from pydantic import TypeAdapter
 from app.config import settings
 from app.models.github_models import (
     GitHubUser,
@@ -16,17 +22,176 @@ from app.models.github_models import (
 )
 from app.services.cache_service import cache_service
 
+# Validadores das respostas em lista do GitHub
+_USER_LIST_ADAPTER = TypeAdapter(List[GitHubUser])
+_REPO_LIST_ADAPTER = TypeAdapter(List[GitHubRepository])
+_EVENT_LIST_ADAPTER = TypeAdapter(List[GitHubEvent])
+_COMMIT_LIST_ADAPTER = TypeAdapter(List[GitHubCommit])
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[GitHubIssue])
+_PULL_REQUEST_LIST_ADAPTER = TypeAdapter(List[GitHubPullRequest])
+
+# Tempo em que respostas expiradas ficam guardadas para revalidação via ETag
+_ETAG_TTL = 3600
+
+# Respostas repetidas com backoff exponencial e jitter, até _MAX_ATTEMPTS tentativas.
+# O timeout do cliente (10s) vale por tentativa; _RETRY_BUDGET limita só a soma das
+# esperas, então o pior caso é ~8s de espera mais _MAX_ATTEMPTS requisições de até 10s
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE = 1.0
+_RETRY_BUDGET = 8.0
+
+# Espera usada entre as tentativas; os testes substituem só este alias
+_sleep = asyncio.sleep
+
+# Cliente HTTP compartilhado entre todas as instâncias de GitHubClient, o event
+# loop ao qual suas conexões pertencem e a tarefa que o fecha junto com o loop
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_client_guard: Optional[asyncio.Task] = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Retorna o event loop em execução, ou None fora de um loop"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> None:
+    """Mantém o cliente aberto enquanto o loop roda e o fecha quando a tarefa é cancelada
+
+    asyncio.run cancela as tarefas pendentes antes de fechar o loop, então as
+    conexões do pool são fechadas no próprio loop que as abriu.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Retorna o cliente HTTP compartilhado, criando-o na primeira chamada
+
+    As conexões do pool ficam presas ao event loop que as abriu; se o loop
+    mudou (por exemplo, chamadas seguidas a asyncio.run), um novo cliente é criado.
+    """
+    global _http_client, _http_client_loop, _http_client_guard
+    loop = _running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0, connect=5.0)
+        )
+        _http_client_loop = loop
+        _http_client_guard = loop.create_task(_close_with_loop(_http_client)) if loop is not None else None
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Fecha o cliente HTTP compartilhado e libera as conexões"""
+    global _http_client, _http_client_loop, _http_client_guard
+    client, loop, guard = _http_client, _http_client_loop, _http_client_guard
+    _http_client = None
+    _http_client_loop = None
+    _http_client_guard = None
+    # Um cliente de outro loop é fechado pela própria tarefa de guarda daquele loop
+    if guard is not None and loop is _running_loop():
+        guard.cancel()
+    if client is not None and loop in (None, _running_loop()):
+        await client.aclose()
+
+
+class GhNotFound(httpx.HTTPStatusError):
+    """Recurso não encontrado no GitHub (404)"""
+
+
+class GhRateLimited(httpx.HTTPStatusError):
+    """Limite de requisições do GitHub atingido (429 ou 403 sem cota restante)"""
+
+
+class GhServerError(httpx.HTTPStatusError):
+    """Erro do lado do GitHub (5xx) que persistiu após as novas tentativas"""
+
+
+def _retry_delay(response: httpx.Response, attempt: int, budget: float) -> Optional[float]:
+    """Calcula a espera antes da próxima tentativa, respeitando o Retry-After
+
+    Retorna None quando o Retry-After pedido não cabe no orçamento restante.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        delay = float(retry_after)
+        return delay if delay <= budget else None
+    return random.uniform(0, min(budget, _BACKOFF_BASE * 2 ** (attempt - 1)))
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """Levanta a exceção tipada correspondente ao status de erro da resposta"""
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        status = response.status_code
+        error_cls: type[httpx.HTTPStatusError]
+        if status == 404:
+            error_cls = GhNotFound
+        elif status == 429 or (status == 403 and response.headers.get("X-RateLimit-Remaining") == "0"):
+            error_cls = GhRateLimited
+        elif status >= 500:
+            error_cls = GhServerError
+        else:
+            raise
+        raise error_cls(str(e), request=e.request, response=response) from None
+
 
 class GitHubClient:
     """Cliente para interagir com a API do GitHub"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.base_url = settings.github_api_base_url
         self.token = settings.github_token
-        self.headers = self._get_headers()
+        # Um cliente injetado pertence a esta instância; o padrão é o compartilhado
+        self._owns_client = http_client is not None
+        self._http_client = http_client
+    
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Cliente HTTP usado nas requisições, resolvido no event loop atual"""
+        return self._http_client or get_http_client()
+    
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP se ele pertencer a esta instância"""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def __aenter__(self) -> "GitHubClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    @property
+    def token(self) -> Optional[str]:
+        """Token de acesso usado no header Authorization"""
+        return self._token
+    
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        # Os headers dependem do token e são reconstruídos na próxima requisição
+        self._headers_cache: Optional[Dict[str, str]] = None
+    
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Visão somente leitura dos headers das requisições, construídos uma vez por token"""
+        return MappingProxyType(self._get_headers())
     
     def _get_headers(self) -> Dict[str, str]:
-        """Retorna os headers para as requisições"""
+        """Retorna os headers para as requisições, reaproveitando o dict já construído"""
+        if self._headers_cache is not None:
+            return self._headers_cache
+        
         headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-Data-API/0.1.0"
@@ -35,51 +200,124 @@ class GitHubClient:
         if self.token:
             headers["Authorization"] = f"token {self.token}"
         
+        self._headers_cache = headers
         return headers
     
-    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Faz uma requisição para a API do GitHub"""
-        url = f"{self.base_url}{endpoint}"
+    async def _get(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        max_attempts: int = _MAX_ATTEMPTS
+    ) -> httpx.Response:
+        """Faz o GET repetindo respostas 429/5xx com backoff exponencial e jitter
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        A espera total é limitada a _RETRY_BUDGET; se o Retry-After passar do
+        que resta, a resposta de erro é devolvida sem esperar. Com max_attempts=1
+        não há novas tentativas.
+        """
+        budget = _RETRY_BUDGET
+        for attempt in range(1, max_attempts + 1):
+            response = await self._client.get(url, headers=headers, params=params)
+            if response.status_code not in _RETRY_STATUSES or attempt == max_attempts:
+                return response
+            delay = _retry_delay(response, attempt, budget)
+            if delay is None:
+                return response
+            budget -= delay
+            await _sleep(delay)
+        raise AssertionError("unreachable: a última tentativa sempre devolve a resposta")
     
-    async def get_user(self, username: str) -> GitHubUser:
-        """Obtém dados de um usuário do GitHub"""
-        cache_key = f"user:{username}"
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Gera a chave de cache de uma requisição a partir do endpoint e dos parâmetros"""
+        query = "&".join(f"{key}={value}" for key, value in sorted((params or {}).items()))
+        return f"github:{endpoint}?{query}"
+    
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: int = settings.cache_ttl,
+        max_attempts: int = _MAX_ATTEMPTS
+    ) -> Dict[str, Any]:
+        """Faz uma requisição para a API do GitHub, usando o cache quando ttl > 0
+        
+        Entradas expiradas continuam guardadas com o ETag da resposta; na próxima
+        requisição o GitHub é consultado com If-None-Match e, se devolver 304, os
+        dados já decodificados são reaproveitados (304 não consome rate limit).
+        Só a decodificação do JSON é poupada; a validação pydantic fica com quem chama.
+        """
+        cache_key = self._cache_key(endpoint, params)
         
         # Tenta obter do cache
-        cached_data = cache_service.get(cache_key)
-        if cached_data:
-            return GitHubUser(**cached_data)
+        cached = cache_service.get(cache_key) if ttl > 0 else None
+        if cached is not None and cached["expires_at"] > time.time():
+            return cached["data"]
         
-        # Busca da API
-        data = await self._make_request(f"/users/{username}")
+        url = f"{self.base_url}{endpoint}"
+        headers = self._get_headers()
+        if cached is not None and cached["etag"]:
+            headers = {**headers, "If-None-Match": cached["etag"]}
+        
+        response = await self._get(url, headers, params, max_attempts)
+        if response.status_code == 304 and cached is not None:
+            data = cached["data"]
+        else:
+            _raise_for_status(response)
+            data = orjson.loads(response.content)
+        
+        # Armazena no cache
+        if ttl > 0:
+            cache_service.set(cache_key, {
+                "data": data,
+                "etag": response.headers.get("ETag") or (cached or {}).get("etag"),
+                "expires_at": time.time() + ttl
+            }, ttl=max(ttl, _ETAG_TTL))
+        
+        return data
+    
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Percorre todas as páginas de um endpoint de listagem, item a item
         
-        # Armazena no cache (5 minutos)
-        cache_service.set(cache_key, data, ttl=300)
+        Cada página é buscada só quando a anterior foi consumida, então o
+        chamador pode interromper a iteração a qualquer momento. Para ao
+        receber uma página vazia ou quando o header Link não traz rel="next".
+        """
+        url = f"{self.base_url}{endpoint}"
+        params = {**(params or {}), "per_page": per_page}
+        page = 1
         
+        while True:
+            response = await self._get(url, self._get_headers(), {**params, "page": page})
+            _raise_for_status(response)
+            items = orjson.loads(response.content)
+            if not items:
+                return
+            
+            for item in items:
+                yield item
+            
+            if "next" not in response.links:
+                return
+            page += 1
+    
+    async def get_user(self, username: str) -> GitHubUser:
+        """Obtém dados de um usuário do GitHub"""
+        data = await self._make_request(f"/users/{username}")
         return GitHubUser(**data)
     
     async def get_user_repositories(self, username: str, page: int = 1, per_page: int = 30) -> List[GitHubRepository]:
         """Obtém repositórios de um usuário"""
-        cache_key = f"user_repos:{username}:{page}:{per_page}"
-        
-        # Tenta obter do cache
-        cached_data = cache_service.get(cache_key)
-        if cached_data:
-            return [GitHubRepository(**repo) for repo in cached_data]
-        
-        # Busca da API
         params = {"page": page, "per_page": per_page, "sort": "updated"}
-        data = await self._make_request(f"/users/{username}/repos", params)
-        
-        # Armazena no cache (10 minutos)
-        cache_service.set(cache_key, data, ttl=600)
-        
-        return [GitHubRepository(**repo) for repo in data]
+        # Repositórios mudam menos: cache de 10 minutos
+        data = await self._make_request(f"/users/{username}/repos", params, ttl=600)
+        return _REPO_LIST_ADAPTER.validate_python(data)
     
     async def get_repository(self, owner: str, repo: str) -> GitHubRepository:
         """Obtém dados de um repositório específico"""
@@ -90,56 +328,66 @@ class GitHubClient:
         """Obtém as linguagens de programação de um repositório"""
         data = await self._make_request(f"/repos/{owner}/{repo}/languages")
         
-        # Calcula o total de bytes
+        # Total de bytes e fator de conversão para porcentagem
         total_bytes = sum(data.values())
+        scale = 100.0 / total_bytes if total_bytes > 0 else 0.0
         
         # Cria os objetos GitHubLanguage com porcentagens
-        languages = {}
-        for name, bytes_count in data.items():
-            percentage = (bytes_count / total_bytes) * 100 if total_bytes > 0 else 0
-            languages[name] = GitHubLanguage(
-                name=name,
-                bytes=bytes_count,
-                percentage=round(percentage, 2)
-            )
-        
-        return languages
+        return {
+            name: GitHubLanguage(name=name, bytes=bytes_count, percentage=round(bytes_count * scale, 2))
+            for name, bytes_count in data.items()
+        }
     
     async def get_repository_events(self, owner: str, repo: str, page: int = 1, per_page: int = 30) -> List[GitHubEvent]:
         """Obtém eventos de um repositório"""
         params = {"page": page, "per_page": per_page}
         data = await self._make_request(f"/repos/{owner}/{repo}/events", params)
-        return [GitHubEvent(**event) for event in data]
+        return _EVENT_LIST_ADAPTER.validate_python(data)
     
     async def get_repository_commits(self, owner: str, repo: str, page: int = 1, per_page: int = 30) -> List[GitHubCommit]:
         """Obtém commits de um repositório"""
         params = {"page": page, "per_page": per_page}
         data = await self._make_request(f"/repos/{owner}/{repo}/commits", params)
-        return [GitHubCommit(**commit) for commit in data]
+        return _COMMIT_LIST_ADAPTER.validate_python(data)
+    
+    async def iter_repository_commits(self, owner: str, repo: str) -> AsyncIterator[GitHubCommit]:
+        """Itera sobre todos os commits de um repositório, página por página"""
+        async for item in self.paginate(f"/repos/{owner}/{repo}/commits"):
+            yield GitHubCommit.model_validate(item)
     
     async def get_repository_issues(self, owner: str, repo: str, state: str = "open", page: int = 1, per_page: int = 30) -> List[GitHubIssue]:
         """Obtém issues de um repositório"""
         params = {"state": state, "page": page, "per_page": per_page}
         data = await self._make_request(f"/repos/{owner}/{repo}/issues", params)
-        return [GitHubIssue(**issue) for issue in data]
+        return _ISSUE_LIST_ADAPTER.validate_python(data)
+    
+    async def iter_repository_issues(self, owner: str, repo: str, state: str = "open") -> AsyncIterator[GitHubIssue]:
+        """Itera sobre todas as issues de um repositório, página por página"""
+        async for item in self.paginate(f"/repos/{owner}/{repo}/issues", {"state": state}):
+            yield GitHubIssue.model_validate(item)
     
     async def get_repository_pull_requests(self, owner: str, repo: str, state: str = "open", page: int = 1, per_page: int = 30) -> List[GitHubPullRequest]:
         """Obtém Pull Requests de um repositório"""
         params = {"state": state, "page": page, "per_page": per_page}
         data = await self._make_request(f"/repos/{owner}/{repo}/pulls", params)
-        return [GitHubPullRequest(**pr) for pr in data]
+        return _PULL_REQUEST_LIST_ADAPTER.validate_python(data)
+    
+    async def iter_repository_pull_requests(self, owner: str, repo: str, state: str = "open") -> AsyncIterator[GitHubPullRequest]:
+        """Itera sobre todos os Pull Requests de um repositório, página por página"""
+        async for item in self.paginate(f"/repos/{owner}/{repo}/pulls", {"state": state}):
+            yield GitHubPullRequest.model_validate(item)
     
     async def search_repositories(self, query: str, page: int = 1, per_page: int = 30) -> List[GitHubRepository]:
         """Busca repositórios no GitHub"""
         params = {"q": query, "page": page, "per_page": per_page, "sort": "stars"}
         data = await self._make_request("/search/repositories", params)
-        return [GitHubRepository(**repo) for repo in data.get("items", [])]
+        return _REPO_LIST_ADAPTER.validate_python(data.get("items", []))
     
     async def search_users(self, query: str, page: int = 1, per_page: int = 30) -> List[GitHubUser]:
         """Busca usuários no GitHub"""
         params = {"q": query, "page": page, "per_page": per_page}
         data = await self._make_request("/search/users", params)
-        return [GitHubUser(**user) for user in data.get("items", [])]
+        return _USER_LIST_ADAPTER.validate_python(data.get("items", []))
     
     async def get_user_languages(self, username: str) -> Dict[str, GitHubLanguage]:
         """Obtém as linguagens de programação mais usadas por um usuário"""
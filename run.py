@@ -3,6 +3,7 @@
 Script de inicialização da GitHub Data API e execução de testes
 """
 
+import importlib.util
 import sys
 import subprocess
 import uvicorn
@@ -15,10 +16,14 @@ def run_tests():
     print("=" * 50)
     
     try:
+        command = [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"]
+        
+        # Distribui os testes entre os núcleos se pytest-xdist estiver instalado
+        if importlib.util.find_spec("xdist") is not None:
+            command += ["-n", "auto", "--dist", "loadgroup"]
+        
         # Executa pytest com todos os testes
-        result = subprocess.run([
-            sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"
-        ], capture_output=True, text=True, cwd=".")
+        result = subprocess.run(command, capture_output=True, text=True, cwd=".")
         
         print(result.stdout)
         
@@ -0,0 +1,187 @@
+"""
+Fixtures compartilhadas pelos testes da GitHub Data API
+"""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import MagicMock
+
+# Por padrão os testes usam só o cache em memória, evitando sondar o Redis a cada
+# CacheService(); USE_REDIS_CACHE=true no ambiente roda a suíte contra o Redis.
+# Precisa vir antes de importar a aplicação, que lê as configurações na importação
+os.environ.setdefault("USE_REDIS_CACHE", "false")
+
+from pydantic import HttpUrl  # noqa: E402
+from httpx import AsyncClient, ASGITransport  # noqa: E402
+from app.main import app  # noqa: E402
+from app.api.routes import get_github_client  # noqa: E402
+from app.services.github_client import GitHubClient  # noqa: E402
+from app.models.github_models import (  # noqa: E402
+    GitHubUser,
+    GitHubRepository,
+    GitHubEvent,
+    GitHubCommit,
+    GitHubIssue,
+    GitHubPullRequest,
+)
+
+try:
+    import uvloop
+except ImportError:  # uvloop não está disponível no Windows
+    uvloop = None
+
+# Gera o schema OpenAPI, guardado em app.openapi_schema
+app.openapi()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Executa os testes assíncronos sobre o uvloop quando disponível"""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return None
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Cliente assíncrono único da sessão, despachando direto para a aplicação ASGI
+    
+    O lifespan da aplicação roda uma vez, e a primeira requisição aquece o
+    roteamento antes dos testes.
+    """
+    lifespan = app.router.lifespan_context(app)
+    c = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    
+    async def startup():
+        await lifespan.__aenter__()
+        await c.get("/")
+    
+    async def shutdown():
+        await c.aclose()
+        await lifespan.__aexit__(None, None, None)
+    
+    asyncio.run(startup())
+    yield c
+    asyncio.run(shutdown())
+
+
+@pytest.fixture
+def gh():
+    """Mock do GitHubClient injetado via dependency override"""
+    mock = MagicMock(spec=GitHubClient)
+    app.dependency_overrides[get_github_client] = lambda: mock
+    yield mock
+    app.dependency_overrides.pop(get_github_client, None)
+
+
+@pytest.fixture(scope="session")
+def sample_user():
+    """Usuário de exemplo (octocat)"""
+    return GitHubUser.model_construct(
+        id=583231,
+        login="octocat",
+        name="The Octocat",
+        email=None,
+        avatar_url="https://avatars.githubusercontent.com/u/583231?v=4",
+        bio=None,
+        location="San Francisco",
+        company="@github",
+        public_repos=8,
+        public_gists=8,
+        followers=1000,
+        following=9,
+        type="User",
+        site_admin=False
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_repo():
+    """Repositório de exemplo (octocat/test-repo)"""
+    return GitHubRepository.model_construct(
+        id=1,
+        name="test-repo",
+        full_name="octocat/test-repo",
+        description="Test repository",
+        private=False,
+        fork=False,
+        language="Python",
+        size=100,
+        stargazers_count=10,
+        watchers_count=10,
+        forks_count=5,
+        open_issues_count=2,
+        default_branch="main"
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_event():
+    """Evento PushEvent de exemplo"""
+    return GitHubEvent.model_construct(
+        id="123",
+        type="PushEvent",
+        public=True,
+        repo={"id": 1, "name": "octocat/test-repo"}
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_commit():
+    """Commit de exemplo"""
+    return GitHubCommit.model_construct(
+        sha="abc123",
+        node_id="MDY6Q29tbWl0MTIz",
+        commit={"message": "Initial commit"},
+        url=HttpUrl("https://api.github.com/repos/octocat/test-repo/commits/abc123"),
+        html_url=HttpUrl("https://github.com/octocat/test-repo/commit/abc123"),
+        comments_url=HttpUrl("https://api.github.com/repos/octocat/test-repo/commits/abc123/comments")
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_issue():
+    """Issue aberta de exemplo"""
+    return GitHubIssue.model_construct(
+        id=1,
+        number=1,
+        title="Test Issue",
+        body="This is a test issue",
+        state="open",
+        locked=False,
+        comments=0,
+        author_association="NONE",
+        labels=[]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_pr():
+    """Pull Request aberto de exemplo"""
+    return GitHubPullRequest.model_construct(
+        id=1,
+        number=1,
+        title="Test PR",
+        body="This is a test PR",
+        state="open",
+        locked=False,
+        comments=0,
+        review_comments=0,
+        commits=1,
+        additions=10,
+        deletions=5,
+        changed_files=2,
+        author_association="NONE",
+        labels=[],
+        head={"ref": "feature-branch"},
+        base={"ref": "main"},
+        draft=False,
+        merged=False,
+        mergeable=None,
+        mergeable_state="unknown",
+        comments_url=HttpUrl("https://api.github.com/repos/octocat/test-repo/issues/1/comments"),
+        review_comments_url=HttpUrl("https://api.github.com/repos/octocat/test-repo/pulls/1/comments"),
+        commits_url=HttpUrl("https://api.github.com/repos/octocat/test-repo/pulls/1/commits"),
+        statuses_url=HttpUrl("https://api.github.com/repos/octocat/test-repo/statuses/abc123")
+    )
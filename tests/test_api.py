@@ -2,115 +2,138 @@
 Testes automatizados completos para a GitHub Data API
 """
 
+import orjson
 import pytest
 from datetime import datetime
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch, MagicMock
-from app.main import app
+from app.api import routes
+from app.config import settings
+from app.services.cache_service import cache_service
 from app.models.github_models import (
     GitHubUser,
     GitHubRepository,
     GitHubLanguage,
-    GitHubEvent,
-    GitHubCommit,
-    GitHubIssue,
-    GitHubPullRequest,
 )
 
-# Cliente de teste
-client = TestClient(app)
+
+_REPO_BASE = dict(
+    id=1,
+    name="test-repo",
+    full_name="octocat/test-repo",
+    description="Test repository",
+    private=False,
+    fork=False,
+    language="Python",
+    size=100,
+    stargazers_count=10,
+    watchers_count=10,
+    forks_count=5,
+    open_issues_count=2,
+    default_branch="main"
+)
+
+_USER_BASE = dict(
+    id=1,
+    login="testuser",
+    name="Test User",
+    public_repos=2,
+    public_gists=1,
+    followers=5,
+    following=3,
+    type="User",
+    site_admin=False
+)
+
+
+# Linguagens pré-construídas e compartilhadas pelos testes de linguagens
+_MOCK_LANGS = {
+    "Python": GitHubLanguage.model_construct(name="Python", bytes=1000, percentage=60.0),
+    "JavaScript": GitHubLanguage.model_construct(name="JavaScript", bytes=400, percentage=24.0),
+    "HTML": GitHubLanguage.model_construct(name="HTML", bytes=300, percentage=16.0)
+}
+
+# Erro reaproveitado como side_effect dos mocks; só a mensagem chega à resposta
+_API_ERROR = Exception("API Error")
+
+
+def make_repo(**overrides):
+    """Cria um GitHubRepository a partir dos valores padrão de teste"""
+    return GitHubRepository.model_construct(**{**_REPO_BASE, **overrides})
+
+
+def make_user(**overrides):
+    """Cria um GitHubUser a partir dos valores padrão de teste"""
+    return GitHubUser.model_construct(**{**_USER_BASE, **overrides})
+
+
+def _json(response):
+    """Decodifica o corpo da resposta com orjson"""
+    return orjson.loads(response.content)
+
+
+def assert_error(response, status, detail):
+    """Verifica o status e o detalhe de uma resposta de erro"""
+    assert response.status_code == status
+    assert _json(response)["detail"] == detail
 
 
 class TestHealthEndpoint:
     """Testes para o endpoint de saúde da API"""
     
-    def test_health_check(self):
+    async def test_health_check(self, client):
         """Testa o endpoint de saúde da API"""
-        response = client.get("/api/v1/health")
+        response = await client.get("/api/v1/health")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["status"] == "healthy"
-        assert "funcionando corretamente" in data["message"]
+        assert data["message"] == "GitHub Data API está funcionando corretamente"
 
 
 class TestRootEndpoint:
     """Testes para o endpoint raiz"""
     
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, client):
         """Testa o endpoint raiz da API"""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["message"] == "Bem-vindo à GitHub Data API"
         assert data["version"] == "0.1.0"
         assert "/docs" in data["docs"]
         assert "/api/v1/health" in data["health"]
+    
+    async def test_root_endpoint_static_body(self, client):
+        """Testa que a rota raiz devolve o corpo pré-serializado"""
+        response = await client.get("/")
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == orjson.dumps({
+            "message": "Bem-vindo à GitHub Data API",
+            "version": settings.api_version,
+            "description": settings.api_description,
+            "docs": "/docs",
+            "health": "/api/v1/health"
+        })
 
 
 class TestUserEndpoints:
     """Testes para endpoints de usuários"""
     
-    @patch('app.services.github_client.GitHubClient.get_user')
-    def test_get_user_success(self, mock_get_user):
+    async def test_get_user_success(self, client, gh, sample_user):
         """Testa obtenção de dados de usuário com sucesso"""
-        # Mock do usuário
-        mock_user = GitHubUser(
-            id=583231,
-            login="octocat",
-            name="The Octocat",
-            email=None,
-            avatar_url="https://avatars.githubusercontent.com/u/583231?v=4",
-            bio=None,
-            location="San Francisco",
-            company="@github",
-            public_repos=8,
-            public_gists=8,
-            followers=1000,
-            following=9,
-            type="User",
-            site_admin=False
-        )
-        mock_get_user.return_value = mock_user
-        
-        response = client.get("/api/v1/users/octocat")
+        gh.get_user.return_value = sample_user
+        
+        response = await client.get("/api/v1/users/octocat")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["login"] == "octocat"
         assert data["name"] == "The Octocat"
         assert data["id"] == 583231
     
-    @patch('app.services.github_client.GitHubClient.get_user')
-    def test_get_user_not_found(self, mock_get_user):
-        """Testa obtenção de usuário inexistente"""
-        mock_get_user.side_effect = Exception("User not found")
-        
-        response = client.get("/api/v1/users/nonexistent")
-        assert response.status_code == 404
-        data = response.json()
-        assert "não encontrado" in data["detail"]
-    
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_success(self, mock_get_repos):
+    async def test_get_user_repositories_success(self, client, gh):
         """Testa obtenção de repositórios de usuário com sucesso"""
         # Mock dos repositórios
         mock_repos = [
-            GitHubRepository(
-                id=1,
-                name="test-repo",
-                full_name="octocat/test-repo",
-                description="Test repository",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
-                stargazers_count=10,
-                watchers_count=10,
-                forks_count=5,
-                open_issues_count=2,
-                default_branch="main",
-                topics=["test", "python"]
-            ),
-            GitHubRepository(
+            make_repo(topics=["test", "python"]),
+            make_repo(
                 id=2,
                 name="test-repo-2",
                 full_name="octocat/test-repo-2",
@@ -122,15 +145,14 @@ class TestUserEndpoints:
                 stargazers_count=5,
                 watchers_count=5,
                 forks_count=2,
-                open_issues_count=1,
-                default_branch="main"
+                open_issues_count=1
             )
         ]
-        mock_get_repos.return_value = mock_repos
+        gh.get_user_repositories.return_value = mock_repos
         
-        response = client.get("/api/v1/users/octocat/repositories")
+        response = await client.get("/api/v1/users/octocat/repositories")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 2
         assert data[0]["name"] == "test-repo"
         assert data[0]["language"] == "Python"
@@ -140,117 +162,88 @@ class TestUserEndpoints:
         assert data[1]["private"] == True
         assert data[1]["fork"] == True
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_with_max_per_page(self, mock_get_repos):
+    async def test_get_user_repositories_with_max_per_page(self, client, gh):
         """Testa obtenção de repositórios com máximo de itens por página"""
         mock_repos = [
-            GitHubRepository(
+            make_repo(
                 id=i,
                 name=f"test-repo-{i}",
                 full_name=f"octocat/test-repo-{i}",
-                description=f"Test repository {i}",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
-                stargazers_count=10,
-                watchers_count=10,
-                forks_count=5,
-                open_issues_count=2,
-                default_branch="main"
+                description=f"Test repository {i}"
             )
             for i in range(1, 101)  # 100 repositórios
         ]
-        mock_get_repos.return_value = mock_repos
+        gh.get_user_repositories.return_value = mock_repos
         
-        response = client.get("/api/v1/users/octocat/repositories?per_page=100")
+        response = await client.get("/api/v1/users/octocat/repositories?per_page=100")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 100
-        mock_get_repos.assert_called_once_with("octocat", 1, 100)
+        gh.get_user_repositories.assert_called_once_with("octocat", 1, 100)
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_empty(self, mock_get_repos):
+    async def test_get_user_repositories_empty(self, client, gh):
         """Testa obtenção de repositórios quando usuário não tem repositórios"""
-        mock_get_repos.return_value = []
+        gh.get_user_repositories.return_value = []
         
-        response = client.get("/api/v1/users/emptyuser/repositories")
+        response = await client.get("/api/v1/users/emptyuser/repositories")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 0
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_all_types(self, mock_get_repos):
+    async def test_get_user_repositories_all_types(self, client, gh):
         """Testa obtenção de todos os tipos de repositórios (públicos, privados, forks)"""
         # Mock de repositórios com diferentes tipos
         mock_repos = [
-            GitHubRepository(
-                id=1,
+            make_repo(
                 name="public-repo",
                 full_name="octocat/public-repo",
-                description="Public repository",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
-                stargazers_count=10,
-                watchers_count=10,
-                forks_count=5,
-                open_issues_count=2,
-                default_branch="main"
+                description="Public repository"
             ),
-            GitHubRepository(
+            make_repo(
                 id=2,
                 name="private-repo",
                 full_name="octocat/private-repo",
                 description="Private repository",
                 private=True,
-                fork=False,
                 language="JavaScript",
                 size=200,
                 stargazers_count=0,
                 watchers_count=0,
                 forks_count=0,
-                open_issues_count=0,
-                default_branch="main"
+                open_issues_count=0
             ),
-            GitHubRepository(
+            make_repo(
                 id=3,
                 name="forked-repo",
                 full_name="octocat/forked-repo",
                 description="Forked repository",
-                private=False,
                 fork=True,
                 language="TypeScript",
                 size=150,
                 stargazers_count=5,
                 watchers_count=5,
                 forks_count=2,
-                open_issues_count=1,
-                default_branch="main"
+                open_issues_count=1
             ),
-            GitHubRepository(
+            make_repo(
                 id=4,
                 name="archived-repo",
                 full_name="octocat/archived-repo",
                 description="Archived repository",
-                private=False,
-                fork=False,
                 language="HTML",
                 size=50,
                 stargazers_count=2,
                 watchers_count=2,
                 forks_count=1,
                 open_issues_count=0,
-                default_branch="main",
                 archived=True
             )
         ]
-        mock_get_repos.return_value = mock_repos
+        gh.get_user_repositories.return_value = mock_repos
         
-        response = client.get("/api/v1/users/octocat/repositories")
+        response = await client.get("/api/v1/users/octocat/repositories")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 4
         
         # Verifica se todos os tipos estão presentes
@@ -272,38 +265,26 @@ class TestUserEndpoints:
         assert forked_repo["fork"] == True
         assert archived_repo.get("archived") == True
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_with_pagination(self, mock_get_repos):
+    async def test_get_user_repositories_with_pagination(self, client, gh):
         """Testa paginação de repositórios"""
-        mock_get_repos.return_value = []
+        gh.get_user_repositories.return_value = []
         
-        response = client.get("/api/v1/users/octocat/repositories?page=2&per_page=10")
+        response = await client.get("/api/v1/users/octocat/repositories?page=2&per_page=10")
         assert response.status_code == 200
-        mock_get_repos.assert_called_once_with("octocat", 2, 10)
+        gh.get_user_repositories.assert_called_once_with("octocat", 2, 10)
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_summary_success(self, mock_get_repos):
+    async def test_get_user_repositories_summary_success(self, client, gh):
         """Testa obtenção de resumo de repositórios com sucesso"""
         # Mock dos repositórios
         mock_repos = [
-            GitHubRepository(
-                id=1,
+            make_repo(
                 name="test-repo-1",
                 full_name="octocat/test-repo-1",
                 description="First test repository",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
-                stargazers_count=10,
-                watchers_count=10,
-                forks_count=5,
-                open_issues_count=2,
-                default_branch="main",
                 created_at=datetime.fromisoformat("2025-01-01T10:00:00+00:00"),
                 updated_at=datetime.fromisoformat("2025-07-29T16:00:00+00:00")
             ),
-            GitHubRepository(
+            make_repo(
                 id=2,
                 name="test-repo-2",
                 full_name="octocat/test-repo-2",
@@ -316,33 +297,28 @@ class TestUserEndpoints:
                 watchers_count=5,
                 forks_count=2,
                 open_issues_count=1,
-                default_branch="main",
                 created_at=datetime.fromisoformat("2025-01-02T10:00:00+00:00"),
                 updated_at=datetime.fromisoformat("2025-07-28T15:00:00+00:00")
             ),
-            GitHubRepository(
+            make_repo(
                 id=3,
                 name="test-repo-3",
                 full_name="octocat/test-repo-3",
                 description="Third test repository",
-                private=False,
-                fork=False,
-                language="Python",
                 size=150,
                 stargazers_count=15,
                 watchers_count=15,
                 forks_count=8,
                 open_issues_count=3,
-                default_branch="main",
                 created_at=datetime.fromisoformat("2025-01-03T10:00:00+00:00"),
                 updated_at=datetime.fromisoformat("2025-07-27T14:00:00+00:00")
             )
         ]
-        mock_get_repos.return_value = mock_repos
+        gh.get_user_repositories.return_value = mock_repos
         
-        response = client.get("/api/v1/users/octocat/repositories/summary")
+        response = await client.get("/api/v1/users/octocat/repositories/summary")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         # Verifica estrutura básica
         assert data["username"] == "octocat"
@@ -387,14 +363,13 @@ class TestUserEndpoints:
         assert recent_activity[1]["name"] == "test-repo-2"
         assert recent_activity[2]["name"] == "test-repo-3"  # mais antigo
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_summary_empty(self, mock_get_repos):
+    async def test_get_user_repositories_summary_empty(self, client, gh):
         """Testa resumo de repositórios quando usuário não tem repositórios"""
-        mock_get_repos.return_value = []
+        gh.get_user_repositories.return_value = []
         
-        response = client.get("/api/v1/users/emptyuser/repositories/summary")
+        response = await client.get("/api/v1/users/emptyuser/repositories/summary")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert data["username"] == "emptyuser"
         summary = data["summary"]
@@ -409,56 +384,32 @@ class TestUserEndpoints:
         assert data["top_repositories"] == []
         assert data["recent_activity"] == []
     
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_summary_error(self, mock_get_repos):
-        """Testa erro ao buscar resumo de repositórios"""
-        mock_get_repos.side_effect = Exception("API Error")
-        
-        response = client.get("/api/v1/users/erroruser/repositories/summary")
-        assert response.status_code == 404
-        data = response.json()
-        assert "Erro ao buscar resumo dos repositórios" in data["detail"]
-    
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_get_user_repositories_summary_without_language(self, mock_get_repos):
+    async def test_get_user_repositories_summary_without_language(self, client, gh):
         """Testa resumo de repositórios com repositórios sem linguagem definida"""
         mock_repos = [
-            GitHubRepository(
-                id=1,
+            make_repo(
                 name="repo-with-language",
                 full_name="octocat/repo-with-language",
-                description="Repository with language",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
-                stargazers_count=10,
-                watchers_count=10,
-                forks_count=5,
-                open_issues_count=2,
-                default_branch="main"
+                description="Repository with language"
             ),
-            GitHubRepository(
+            make_repo(
                 id=2,
                 name="repo-without-language",
                 full_name="octocat/repo-without-language",
                 description="Repository without language",
-                private=False,
-                fork=False,
-                language=None,  # Sem linguagem definida
+                language=None,
                 size=200,
                 stargazers_count=5,
                 watchers_count=5,
                 forks_count=2,
-                open_issues_count=1,
-                default_branch="main"
+                open_issues_count=1
             )
         ]
-        mock_get_repos.return_value = mock_repos
+        gh.get_user_repositories.return_value = mock_repos
         
-        response = client.get("/api/v1/users/octocat/repositories/summary")
+        response = await client.get("/api/v1/users/octocat/repositories/summary")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         # Verifica que apenas Python está nas linguagens (repo sem linguagem é ignorado)
         languages = data["languages"]
@@ -474,41 +425,19 @@ class TestUserEndpoints:
         assert "repo-with-language" in repo_names
         assert "repo-without-language" in repo_names
 
-    @patch('app.services.github_client.GitHubClient.get_user_languages')
-    def test_get_user_languages_success(self, mock_get_languages):
-        """Testa obtenção de linguagens do usuário com sucesso"""
-        mock_languages = {
-            "Python": {"count": 5, "percentage": 50.0},
-            "JavaScript": {"count": 3, "percentage": 30.0},
-            "TypeScript": {"count": 2, "percentage": 20.0}
-        }
-        mock_get_languages.return_value = mock_languages
+    async def test_get_user_languages_success(self, gh):
+        """Testa obtenção de linguagens do usuário chamando o handler diretamente"""
+        gh.get_user_languages.return_value = _MOCK_LANGS
         
-        response = client.get("/api/v1/users/octocat/languages")
-        assert response.status_code == 200
-        data = response.json()
+        data = await routes.get_user_languages("octocat", client=gh)
         
         assert data["username"] == "octocat"
         assert data["total_languages"] == 3
-        assert "Python" in data["languages"]
-        assert data["languages"]["Python"]["count"] == 5
-        assert data["languages"]["Python"]["percentage"] == 50.0
-        assert "JavaScript" in data["languages"]
-        assert "TypeScript" in data["languages"]
-
-    @patch('app.services.github_client.GitHubClient.get_user_languages')
-    def test_get_user_languages_error(self, mock_get_languages):
-        """Testa erro ao buscar linguagens do usuário"""
-        mock_get_languages.side_effect = Exception("API Error")
-        
-        response = client.get("/api/v1/users/erroruser/languages")
-        assert response.status_code == 404
-        data = response.json()
-        assert "Erro ao buscar linguagens" in data["detail"]
-
-    @patch('app.services.github_client.GitHubClient.get_user_stats')
-    def test_get_user_stats_success(self, mock_get_stats):
-        """Testa obtenção de estatísticas do usuário com sucesso"""
+        assert data["languages"] is _MOCK_LANGS
+        gh.get_user_languages.assert_awaited_once_with("octocat")
+
+    async def test_get_user_stats_success(self, gh):
+        """Testa obtenção de estatísticas do usuário chamando o handler diretamente"""
         mock_stats = {
             "user": {
                 "id": 583231,
@@ -543,11 +472,9 @@ class TestUserEndpoints:
                 }
             ]
         }
-        mock_get_stats.return_value = mock_stats
+        gh.get_user_stats.return_value = mock_stats
         
-        response = client.get("/api/v1/users/octocat/stats")
-        assert response.status_code == 200
-        data = response.json()
+        data = await routes.get_user_stats("octocat", client=gh)
         
         assert data["username"] == "octocat"
         assert data["user"]["login"] == "octocat"
@@ -558,185 +485,79 @@ class TestUserEndpoints:
         assert len(data["top_repositories"]) == 1
         assert data["top_repositories"][0]["name"] == "best-repo"
 
-    @patch('app.services.github_client.GitHubClient.get_user_stats')
-    def test_get_user_stats_error(self, mock_get_stats):
-        """Testa erro ao buscar estatísticas do usuário"""
-        mock_get_stats.side_effect = Exception("API Error")
-        
-        response = client.get("/api/v1/users/erroruser/stats")
-        assert response.status_code == 404
-        data = response.json()
-        assert "Erro ao buscar estatísticas" in data["detail"]
-
 
 class TestRepositoryEndpoints:
     """Testes para endpoints de repositórios"""
     
-    @patch('app.services.github_client.GitHubClient.get_repository')
-    def test_get_repository_success(self, mock_get_repo):
+    async def test_get_repository_success(self, client, gh, sample_repo):
         """Testa obtenção de dados de repositório com sucesso"""
-        mock_repo = GitHubRepository(
-            id=1,
-            name="test-repo",
-            full_name="octocat/test-repo",
-            description="Test repository",
-            private=False,
-            fork=False,
-            language="Python",
-            size=100,
-            stargazers_count=10,
-            watchers_count=10,
-            forks_count=5,
-            open_issues_count=2,
-            default_branch="main"
-        )
-        mock_get_repo.return_value = mock_repo
-        
-        response = client.get("/api/v1/repos/octocat/test-repo")
+        gh.get_repository.return_value = sample_repo
+        
+        response = await client.get("/api/v1/repos/octocat/test-repo")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["name"] == "test-repo"
         assert data["full_name"] == "octocat/test-repo"
         assert data["language"] == "Python"
     
-    @patch('app.services.github_client.GitHubClient.get_repository')
-    def test_get_repository_not_found(self, mock_get_repo):
-        """Testa obtenção de repositório inexistente"""
-        mock_get_repo.side_effect = Exception("Repository not found")
-        
-        response = client.get("/api/v1/repos/octocat/nonexistent")
-        assert response.status_code == 404
-        data = response.json()
-        assert "não encontrado" in data["detail"]
-    
-    @patch('app.services.github_client.GitHubClient.get_repository_languages')
-    def test_get_repository_languages_success(self, mock_get_languages):
+    async def test_get_repository_languages_success(self, client, gh):
         """Testa obtenção de linguagens de repositório"""
-        mock_languages = {
-            "Python": GitHubLanguage(name="Python", bytes=1000, percentage=60.0),
-            "JavaScript": GitHubLanguage(name="JavaScript", bytes=400, percentage=24.0),
-            "HTML": GitHubLanguage(name="HTML", bytes=300, percentage=16.0)
-        }
-        mock_get_languages.return_value = mock_languages
+        gh.get_repository_languages.return_value = _MOCK_LANGS
         
-        response = client.get("/api/v1/repos/octocat/test-repo/languages")
+        response = await client.get("/api/v1/repos/octocat/test-repo/languages")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["repository"] == "octocat/test-repo"
         assert data["total_languages"] == 3
         assert "Python" in data["languages"]
         assert data["languages"]["Python"]["percentage"] == 60.0
     
-    @patch('app.services.github_client.GitHubClient.get_repository_events')
-    def test_get_repository_events_success(self, mock_get_events):
+    async def test_get_repository_events_success(self, client, gh, sample_event):
         """Testa obtenção de eventos de repositório"""
-        mock_events = [
-            GitHubEvent(
-                id="123",
-                type="PushEvent",
-                public=True,
-                repo={"id": 1, "name": "octocat/test-repo"}
-            )
-        ]
-        mock_get_events.return_value = mock_events
+        gh.get_repository_events.return_value = [sample_event]
         
-        response = client.get("/api/v1/repos/octocat/test-repo/events")
+        response = await client.get("/api/v1/repos/octocat/test-repo/events")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 1
         assert data[0]["type"] == "PushEvent"
     
-    @patch('app.services.github_client.GitHubClient.get_repository_commits')
-    def test_get_repository_commits_success(self, mock_get_commits):
+    async def test_get_repository_commits_success(self, client, gh, sample_commit):
         """Testa obtenção de commits de repositório"""
-        mock_commits = [
-            GitHubCommit(
-                sha="abc123",
-                node_id="MDY6Q29tbWl0MTIz",
-                commit={"message": "Initial commit"},
-                url="https://api.github.com/repos/octocat/test-repo/commits/abc123",
-                html_url="https://github.com/octocat/test-repo/commit/abc123",
-                comments_url="https://api.github.com/repos/octocat/test-repo/commits/abc123/comments"
-            )
-        ]
-        mock_get_commits.return_value = mock_commits
+        gh.get_repository_commits.return_value = [sample_commit]
         
-        response = client.get("/api/v1/repos/octocat/test-repo/commits")
+        response = await client.get("/api/v1/repos/octocat/test-repo/commits")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 1
         assert data[0]["sha"] == "abc123"
     
-    @patch('app.services.github_client.GitHubClient.get_repository_issues')
-    def test_get_repository_issues_success(self, mock_get_issues):
+    async def test_get_repository_issues_success(self, client, gh, sample_issue):
         """Testa obtenção de issues de repositório"""
-        mock_issues = [
-            GitHubIssue(
-                id=1,
-                number=1,
-                title="Test Issue",
-                body="This is a test issue",
-                state="open",
-                locked=False,
-                comments=0,
-                author_association="NONE",
-                labels=[]
-            )
-        ]
-        mock_get_issues.return_value = mock_issues
+        gh.get_repository_issues.return_value = [sample_issue]
         
-        response = client.get("/api/v1/repos/octocat/test-repo/issues")
+        response = await client.get("/api/v1/repos/octocat/test-repo/issues")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 1
         assert data[0]["title"] == "Test Issue"
         assert data[0]["state"] == "open"
     
-    @patch('app.services.github_client.GitHubClient.get_repository_issues')
-    def test_get_repository_issues_with_state(self, mock_get_issues):
+    async def test_get_repository_issues_with_state(self, client, gh):
         """Testa obtenção de issues com filtro de estado"""
-        mock_get_issues.return_value = []
+        gh.get_repository_issues.return_value = []
         
-        response = client.get("/api/v1/repos/octocat/test-repo/issues?state=closed")
+        response = await client.get("/api/v1/repos/octocat/test-repo/issues?state=closed")
         assert response.status_code == 200
-        mock_get_issues.assert_called_once_with("octocat", "test-repo", "closed", 1, 30)
+        gh.get_repository_issues.assert_called_once_with("octocat", "test-repo", "closed", 1, 30)
     
-    @patch('app.services.github_client.GitHubClient.get_repository_pull_requests')
-    def test_get_repository_pull_requests_success(self, mock_get_prs):
+    async def test_get_repository_pull_requests_success(self, client, gh, sample_pr):
         """Testa obtenção de Pull Requests de repositório"""
-        mock_prs = [
-            GitHubPullRequest(
-                id=1,
-                number=1,
-                title="Test PR",
-                body="This is a test PR",
-                state="open",
-                locked=False,
-                comments=0,
-                review_comments=0,
-                commits=1,
-                additions=10,
-                deletions=5,
-                changed_files=2,
-                author_association="NONE",
-                labels=[],
-                head={"ref": "feature-branch"},
-                base={"ref": "main"},
-                draft=False,
-                merged=False,
-                mergeable=None,
-                mergeable_state="unknown",
-                comments_url="https://api.github.com/repos/octocat/test-repo/issues/1/comments",
-                review_comments_url="https://api.github.com/repos/octocat/test-repo/pulls/1/comments",
-                commits_url="https://api.github.com/repos/octocat/test-repo/pulls/1/commits",
-                statuses_url="https://api.github.com/repos/octocat/test-repo/statuses/abc123"
-            )
-        ]
-        mock_get_prs.return_value = mock_prs
+        gh.get_repository_pull_requests.return_value = [sample_pr]
         
-        response = client.get("/api/v1/repos/octocat/test-repo/pulls")
+        response = await client.get("/api/v1/repos/octocat/test-repo/pulls")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 1
         assert data[0]["title"] == "Test PR"
         assert data[0]["state"] == "open"
@@ -745,84 +566,42 @@ class TestRepositoryEndpoints:
 class TestSearchEndpoints:
     """Testes para endpoints de busca"""
     
-    @patch('app.services.github_client.GitHubClient.search_repositories')
-    def test_search_repositories_success(self, mock_search_repos):
+    async def test_search_repositories_success(self, client, gh, sample_repo):
         """Testa busca de repositórios"""
-        mock_repos = [
-            GitHubRepository(
-                id=1,
-                name="test-repo",
-                full_name="octocat/test-repo",
-                description="Test repository",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
-                stargazers_count=10,
-                watchers_count=10,
-                forks_count=5,
-                open_issues_count=2,
-                default_branch="main"
-            )
-        ]
-        mock_search_repos.return_value = mock_repos
+        gh.search_repositories.return_value = [sample_repo]
         
-        response = client.get("/api/v1/search/repositories?q=python")
+        response = await client.get("/api/v1/search/repositories?q=python")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 1
         assert data[0]["language"] == "Python"
     
-    @patch('app.services.github_client.GitHubClient.search_repositories')
-    def test_search_repositories_with_pagination(self, mock_search_repos):
+    async def test_search_repositories_with_pagination(self, client, gh):
         """Testa busca de repositórios com paginação"""
-        mock_search_repos.return_value = []
+        gh.search_repositories.return_value = []
         
-        response = client.get("/api/v1/search/repositories?q=python&page=2&per_page=20")
+        response = await client.get("/api/v1/search/repositories?q=python&page=2&per_page=20")
         assert response.status_code == 200
-        mock_search_repos.assert_called_once_with("python", 2, 20)
+        gh.search_repositories.assert_called_once_with("python", 2, 20)
     
-    @patch('app.services.github_client.GitHubClient.search_users')
-    def test_search_users_success(self, mock_search_users):
+    async def test_search_users_success(self, client, gh):
         """Testa busca de usuários"""
         mock_users = [
-            GitHubUser(
-                id=1,
-                login="testuser",
-                name="Test User",
-                email=None,
-                public_repos=5,
-                public_gists=2,
-                followers=10,
-                following=5,
-                type="User",
-                site_admin=False
-            )
+            make_user(email=None, public_repos=5, public_gists=2, followers=10, following=5)
         ]
-        mock_search_users.return_value = mock_users
+        gh.search_users.return_value = mock_users
         
-        response = client.get("/api/v1/search/users?q=testuser")
+        response = await client.get("/api/v1/search/users?q=testuser")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data) == 1
         assert data[0]["login"] == "testuser"
     
-    @patch('app.services.github_client.GitHubClient.search_users')
-    def test_search_users_error(self, mock_search_users):
-        """Testa erro na busca de usuários"""
-        mock_search_users.side_effect = Exception("Search error")
-        
-        response = client.get("/api/v1/search/users?q=invalid")
-        assert response.status_code == 400
-        data = response.json()
-        assert "Erro na busca" in data["detail"]
-
 
 class TestCacheEndpoints:
     """Testes para endpoints de cache"""
     
-    @patch('app.services.cache_service.cache_service.get_stats')
-    def test_cache_stats_success(self, mock_get_stats):
+    async def test_cache_stats_success(self, client, monkeypatch):
         """Testa obtenção de estatísticas do cache"""
         mock_stats = {
             "memory_cache_size": 5,
@@ -830,109 +609,104 @@ class TestCacheEndpoints:
             "use_redis": False,
             "redis_connected": False
         }
-        mock_get_stats.return_value = mock_stats
+        monkeypatch.setattr(cache_service, "get_stats", lambda: mock_stats)
         
-        response = client.get("/api/v1/cache/stats")
+        response = await client.get("/api/v1/cache/stats")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["memory_cache_size"] == 5
         assert data["memory_cache_maxsize"] == 1000
         assert data["use_redis"] == False
         assert data["redis_connected"] == False
 
-    @patch('app.services.cache_service.cache_service.clear')
-    def test_clear_cache_success(self, mock_clear):
+    async def test_clear_cache_success(self, client, monkeypatch):
         """Testa limpeza do cache com sucesso"""
-        mock_clear.return_value = True
+        monkeypatch.setattr(cache_service, "clear", lambda: True)
         
-        response = client.delete("/api/v1/cache/clear")
+        response = await client.delete("/api/v1/cache/clear")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["success"] == True
-        assert "Cache limpo com sucesso" in data["message"]
+        assert data["message"] == "Cache limpo com sucesso"
 
-    @patch('app.services.cache_service.cache_service.clear')
-    def test_clear_cache_error(self, mock_clear):
+    async def test_clear_cache_error(self, client, monkeypatch):
         """Testa erro ao limpar cache"""
-        mock_clear.return_value = False
+        monkeypatch.setattr(cache_service, "clear", lambda: False)
         
-        response = client.delete("/api/v1/cache/clear")
+        response = await client.delete("/api/v1/cache/clear")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["success"] == False
-        assert "Erro ao limpar cache" in data["message"]
+        assert data["message"] == "Erro ao limpar cache"
 
 
 class TestErrorHandling:
     """Testes para tratamento de erros"""
     
-    def test_invalid_endpoint(self):
+    @pytest.mark.parametrize("method,url,status,detail", [
+        ("get_user", "/api/v1/users/nonexistent", 404, "Usuário nonexistent não encontrado: API Error"),
+        ("get_user_repositories", "/api/v1/users/erroruser/repositories/summary", 404, "Erro ao buscar resumo dos repositórios: API Error"),
+        ("get_user_languages", "/api/v1/users/erroruser/languages", 404, "Erro ao buscar linguagens: API Error"),
+        ("get_user_stats", "/api/v1/users/erroruser/stats", 404, "Erro ao buscar estatísticas: API Error"),
+        ("get_repository", "/api/v1/repos/octocat/nonexistent", 404, "Repositório octocat/nonexistent não encontrado: API Error"),
+        ("search_users", "/api/v1/search/users?q=invalid", 400, "Erro na busca: API Error"),
+    ])
+    async def test_client_error(self, client, gh, method, url, status, detail):
+        """Testa erros do cliente do GitHub convertidos em respostas HTTP"""
+        getattr(gh, method).side_effect = _API_ERROR
+        
+        response = await client.get(url)
+        assert_error(response, status, detail)
+    
+    async def test_invalid_endpoint(self, client):
         """Testa endpoint inexistente"""
-        response = client.get("/api/v1/invalid")
-        assert response.status_code == 404
+        response = await client.get("/api/v1/invalid")
+        assert_error(response, 404, "Not Found")
     
-    def test_invalid_query_parameters(self):
+    async def test_invalid_query_parameters(self, client):
         """Testa parâmetros de query inválidos"""
-        response = client.get("/api/v1/users/octocat/repositories?page=0")
+        response = await client.get("/api/v1/users/octocat/repositories?page=0")
         assert response.status_code == 422  # Validation error
     
-    def test_missing_required_parameter(self):
+    async def test_missing_required_parameter(self, client):
         """Testa parâmetro obrigatório ausente"""
-        response = client.get("/api/v1/search/repositories")
+        response = await client.get("/api/v1/search/repositories")
         assert response.status_code == 422  # Validation error
 
 
 class TestIntegration:
     """Testes de integração"""
     
-    @patch('app.services.github_client.GitHubClient.get_user')
-    @patch('app.services.github_client.GitHubClient.get_user_repositories')
-    def test_full_user_workflow(self, mock_get_repos, mock_get_user):
+    async def test_full_user_workflow(self, client, gh):
         """Testa workflow completo de usuário"""
         # Mock do usuário
-        mock_user = GitHubUser(
-            id=1,
-            login="testuser",
-            name="Test User",
-            public_repos=2,
-            public_gists=1,
-            followers=5,
-            following=3,
-            type="User",
-            site_admin=False
-        )
-        mock_get_user.return_value = mock_user
+        mock_user = make_user()
+        gh.get_user.return_value = mock_user
         
         # Mock dos repositórios
         mock_repos = [
-            GitHubRepository(
-                id=1,
+            make_repo(
                 name="repo1",
                 full_name="testuser/repo1",
                 description="First repo",
-                private=False,
-                fork=False,
-                language="Python",
-                size=100,
                 stargazers_count=5,
                 watchers_count=5,
                 forks_count=2,
-                open_issues_count=1,
-                default_branch="main"
+                open_issues_count=1
             )
         ]
-        mock_get_repos.return_value = mock_repos
+        gh.get_user_repositories.return_value = mock_repos
         
         # Teste 1: Obter usuário
-        response1 = client.get("/api/v1/users/testuser")
+        response1 = await client.get("/api/v1/users/testuser")
         assert response1.status_code == 200
-        user_data = response1.json()
+        user_data = _json(response1)
         assert user_data["login"] == "testuser"
         
         # Teste 2: Obter repositórios do usuário
-        response2 = client.get("/api/v1/users/testuser/repositories")
+        response2 = await client.get("/api/v1/users/testuser/repositories")
         assert response2.status_code == 200
-        repos_data = response2.json()
+        repos_data = _json(response2)
         assert len(repos_data) == 1
         assert repos_data[0]["name"] == "repo1"
 
@@ -0,0 +1,707 @@
+"""
+Testes do GitHubClient usando transporte HTTP simulado
+"""
+
+import asyncio
+import threading
+import time
+import httpx
+import orjson
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from unittest.mock import AsyncMock
+from app.models.github_models import (
+    GitHubUser,
+    GitHubRepository,
+    GitHubEvent,
+    GitHubCommit,
+    GitHubIssue,
+    GitHubPullRequest,
+)
+from app.config import settings
+from app.services.cache_service import cache_service
+from app.services.github_client import (
+    _ETAG_TTL,
+    _RETRY_BUDGET,
+    GitHubClient,
+    GhNotFound,
+    GhRateLimited,
+    GhServerError,
+    close_http_client,
+    get_http_client,
+)
+
+
+# Payloads simulados compartilhados por todos os testes. MappingProxyType só
+# protege o nível de cima: dicts aninhados (repo, head, base...) não devem ser alterados
+_USER_JSON = MappingProxyType({
+    "id": 583231,
+    "login": "octocat",
+    "name": "The Octocat",
+    "public_repos": 8,
+    "followers": 1000,
+    "following": 9,
+    "type": "User",
+    "site_admin": False
+})
+
+_REPO_JSON = MappingProxyType({
+    "id": 1296269,
+    "name": "Hello-World",
+    "full_name": "octocat/Hello-World",
+    "description": "My first repository on GitHub!",
+    "private": False,
+    "fork": False,
+    "language": "Python",
+    "size": 108,
+    "stargazers_count": 80,
+    "watchers_count": 80,
+    "forks_count": 9,
+    "open_issues_count": 0,
+    "default_branch": "master"
+})
+
+_LANGUAGES_JSON = MappingProxyType({"Python": 6000, "JavaScript": 3000, "HTML": 1000})
+
+_EVENT_JSON = MappingProxyType({
+    "id": "22249084947",
+    "type": "PushEvent",
+    "public": True,
+    "repo": {"id": 1296269, "name": "octocat/Hello-World"}
+})
+
+_COMMIT_JSON = MappingProxyType({
+    "sha": "7fd1a60b01f91b314f59955a4e4d4e80d8edf11d",
+    "node_id": "MDY6Q29tbWl0MTI5NjI2OTo3ZmQxYTYwYjAxZjkxYjMxNGY1OTk1NWE0ZTRkNGU4MGQ4ZWRmMTFk",
+    "commit": {"message": "Merge pull request #6 from Spaceghost/patch-1"},
+    "url": "https://api.github.com/repos/octocat/Hello-World/commits/7fd1a60b01f91b314f59955a4e4d4e80d8edf11d",
+    "html_url": "https://github.com/octocat/Hello-World/commit/7fd1a60b01f91b314f59955a4e4d4e80d8edf11d",
+    "comments_url": "https://api.github.com/repos/octocat/Hello-World/commits/7fd1a60b01f91b314f59955a4e4d4e80d8edf11d/comments"
+})
+
+_ISSUE_JSON = MappingProxyType({
+    "id": 1,
+    "number": 1347,
+    "title": "Found a bug",
+    "body": "I'm having a problem with this.",
+    "state": "open"
+})
+
+_PR_JSON = MappingProxyType({
+    "id": 1,
+    "number": 1347,
+    "title": "Amazing new feature",
+    "body": "Please pull these awesome changes in!",
+    "state": "open",
+    "head": {"ref": "new-topic"},
+    "base": {"ref": "master"},
+    "comments_url": "https://api.github.com/repos/octocat/Hello-World/issues/1347/comments",
+    "review_comments_url": "https://api.github.com/repos/octocat/Hello-World/pulls/1347/comments",
+    "commits_url": "https://api.github.com/repos/octocat/Hello-World/pulls/1347/commits",
+    "statuses_url": "https://api.github.com/repos/octocat/Hello-World/statuses/6dcb09b5b57875f334f61aebed695e2e4193db5e"
+})
+
+# Tabela de rotas simuladas com os corpos já serializados
+_ROUTES = {
+    "/users/octocat": orjson.dumps(dict(_USER_JSON)),
+    "/users/octocat/repos": orjson.dumps([dict(_REPO_JSON)]),
+    "/repos/octocat/Hello-World": orjson.dumps(dict(_REPO_JSON)),
+    "/repos/octocat/Hello-World/languages": orjson.dumps(dict(_LANGUAGES_JSON)),
+    "/repos/octocat/Hello-World/events": orjson.dumps([dict(_EVENT_JSON)]),
+    "/repos/octocat/Hello-World/commits": orjson.dumps([dict(_COMMIT_JSON)]),
+    "/repos/octocat/Hello-World/issues": orjson.dumps([dict(_ISSUE_JSON)]),
+    "/repos/octocat/Hello-World/pulls": orjson.dumps([dict(_PR_JSON)]),
+    "/search/repositories": orjson.dumps({"total_count": 1, "items": [dict(_REPO_JSON)]}),
+    "/search/users": orjson.dumps({"total_count": 1, "items": [dict(_USER_JSON)]}),
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_NOT_FOUND_BODY = b'{"message":"Not Found"}'
+
+# Erro 404 devolvido pelo _make_request simulado nos testes de recurso inexistente
+_NOT_FOUND_REQUEST = httpx.Request("GET", "https://api.github.com/users/ghost")
+_NOT_FOUND_ERROR = httpx.HTTPStatusError(
+    "404 Not Found",
+    request=_NOT_FOUND_REQUEST,
+    response=httpx.Response(404, request=_NOT_FOUND_REQUEST)
+)
+
+# Parâmetros esperados por cada método, somente leitura e reaproveitados
+_PAGE_PARAMS = MappingProxyType({"page": 1, "per_page": 30})
+_USER_REPOS_PARAMS = MappingProxyType({"page": 1, "per_page": 30, "sort": "updated"})
+_STATE_PARAMS = MappingProxyType({"state": "open", "page": 1, "per_page": 30})
+_SEARCH_REPOS_PARAMS = MappingProxyType({"q": "python", "page": 1, "per_page": 30, "sort": "stars"})
+_SEARCH_USERS_PARAMS = MappingProxyType({"q": "octocat", "page": 1, "per_page": 30})
+
+# (método, argumentos, payload, caminho, parâmetros, modelo, campo, valor esperado)
+CASES = [
+    ("get_user", ("octocat",), _USER_JSON,
+     "/users/octocat", None, GitHubUser, "login", "octocat"),
+    ("get_user_repositories", ("octocat",), [_REPO_JSON],
+     "/users/octocat/repos", _USER_REPOS_PARAMS,
+     GitHubRepository, "name", "Hello-World"),
+    ("get_repository", ("octocat", "Hello-World"), _REPO_JSON,
+     "/repos/octocat/Hello-World", None, GitHubRepository, "full_name", "octocat/Hello-World"),
+    ("get_repository_events", ("octocat", "Hello-World"), [_EVENT_JSON],
+     "/repos/octocat/Hello-World/events", _PAGE_PARAMS,
+     GitHubEvent, "type", "PushEvent"),
+    ("get_repository_commits", ("octocat", "Hello-World"), [_COMMIT_JSON],
+     "/repos/octocat/Hello-World/commits", _PAGE_PARAMS,
+     GitHubCommit, "sha", _COMMIT_JSON["sha"]),
+    ("get_repository_issues", ("octocat", "Hello-World"), [_ISSUE_JSON],
+     "/repos/octocat/Hello-World/issues", _STATE_PARAMS,
+     GitHubIssue, "title", "Found a bug"),
+    ("get_repository_pull_requests", ("octocat", "Hello-World"), [_PR_JSON],
+     "/repos/octocat/Hello-World/pulls", _STATE_PARAMS,
+     GitHubPullRequest, "title", "Amazing new feature"),
+    ("search_repositories", ("python",), {"items": [_REPO_JSON]},
+     "/search/repositories", _SEARCH_REPOS_PARAMS,
+     GitHubRepository, "name", "Hello-World"),
+    ("search_users", ("octocat",), {"items": [_USER_JSON]},
+     "/search/users", _SEARCH_USERS_PARAMS,
+     GitHubUser, "login", "octocat"),
+]
+
+
+def _handler(request):
+    """Responde às requisições simuladas de acordo com o caminho
+
+    Cada requisição recebe um httpx.Response novo: o httpx altera a resposta
+    ao enviá-la (request e stream), então ela não pode ser compartilhada.
+    """
+    body = _ROUTES.get(request.url.path)
+    if body is None:
+        return httpx.Response(404, content=_NOT_FOUND_BODY, headers=_JSON_HEADERS)
+    return httpx.Response(200, content=body, headers=_JSON_HEADERS)
+
+
+def _recording_client(paths):
+    """Cria um GitHubClient que registra o caminho de cada requisição enviada"""
+    def handler(request):
+        paths.append(request.url.path)
+        return _handler(request)
+
+    return GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def _paginated_client(total, pages):
+    """Cria um GitHubClient sobre um endpoint de commits simulado com `total` itens"""
+    items = [{**_COMMIT_JSON, "sha": f"{i:040x}"} for i in range(total)]
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        pages.append(page)
+        start = (page - 1) * per_page
+        headers = dict(_JSON_HEADERS)
+        if start + per_page < total:
+            headers["Link"] = f'<{request.url.copy_set_param("page", page + 1)}>; rel="next"'
+        return httpx.Response(200, content=orjson.dumps(items[start:start + per_page]), headers=headers)
+
+    return GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+class FakeClock:
+    """Relógio controlado pelos testes, no lugar do módulo time"""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Relógio falso compartilhado pelo GitHubClient e pelo cache em memória"""
+    clock = FakeClock()
+    monkeypatch.setattr("app.services.github_client.time", clock)
+    monkeypatch.setattr("app.services.cache_service.time", clock)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def mock_transport():
+    """Transporte simulado compartilhado por todos os testes do módulo"""
+    return httpx.MockTransport(_handler)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Garante que o cache global não vaze dados entre os testes"""
+    cache_service.clear()
+    yield
+    cache_service.clear()
+
+
+@pytest.fixture
+async def github_client(mock_transport):
+    """GitHubClient com um AsyncClient montado sobre o transporte simulado"""
+    async with GitHubClient(http_client=httpx.AsyncClient(transport=mock_transport)) as gh:
+        yield gh
+
+
+_MAKE_REQUEST_MOCK = AsyncMock()
+
+
+@pytest.fixture
+def mock_make_request(github_client, monkeypatch):
+    """AsyncMock de _make_request reaproveitado entre testes e limpo ao final de cada um"""
+    monkeypatch.setattr(github_client, "_make_request", _MAKE_REQUEST_MOCK)
+    yield _MAKE_REQUEST_MOCK
+    _MAKE_REQUEST_MOCK.reset_mock(return_value=True, side_effect=True)
+
+
+class TestGitHubClientHeaders:
+    """Testes para a montagem dos headers das requisições"""
+
+    def test_headers_without_token(self):
+        """Testa os headers sem token de acesso"""
+        gh = GitHubClient()
+        gh.token = None
+        headers = gh._get_headers()
+        assert headers["Accept"] == "application/vnd.github.v3+json"
+        assert "Authorization" not in headers
+
+    def test_headers_with_token(self):
+        """Testa que o token é enviado no header Authorization"""
+        gh = GitHubClient()
+        gh.token = "abc123"
+        assert gh._get_headers()["Authorization"] == "token abc123"
+
+    def test_headers_are_cached(self):
+        """Testa que chamadas repetidas devolvem o mesmo dict"""
+        gh = GitHubClient()
+        assert gh._get_headers() is gh._get_headers()
+
+    def test_headers_property_is_read_only(self):
+        """Testa que a propriedade pública não permite alterar os headers em cache"""
+        gh = GitHubClient()
+        with pytest.raises(TypeError):
+            gh.headers["X-Foo"] = "bar"
+        assert "X-Foo" not in gh._get_headers()
+        assert gh.headers == gh._get_headers()
+
+    def test_token_change_invalidates_headers(self):
+        """Testa que trocar o token reconstrói os headers"""
+        gh = GitHubClient()
+        gh.token = None
+        before = gh._get_headers()
+        gh.token = "abc123"
+        after = gh._get_headers()
+        assert after is not before
+        assert after["Authorization"] == "token abc123"
+
+
+class TestGitHubClientRequests:
+    """Testes para as requisições HTTP do cliente"""
+
+    async def test_make_request_success(self, github_client):
+        """Testa requisição com sucesso"""
+        data = await github_client._make_request("/users/octocat")
+        assert data == _USER_JSON
+
+    async def test_make_request_error(self, github_client):
+        """Testa que erros HTTP são propagados"""
+        with pytest.raises(httpx.HTTPStatusError):
+            await github_client._make_request("/users/nonexistent")
+
+    async def test_get_user_success(self, github_client):
+        """Testa obtenção de usuário através do transporte simulado"""
+        user = await github_client.get_user("octocat")
+        assert isinstance(user, GitHubUser)
+        assert user.login == "octocat"
+        assert user.id == 583231
+
+    async def test_make_request_uses_cache(self):
+        """Testa que requisições idênticas só chegam uma vez ao transporte"""
+        paths = []
+        async with _recording_client(paths) as gh:
+            first = await gh.get_user("octocat")
+            second = await gh.get_user("octocat")
+
+        assert paths == ["/users/octocat"]
+        assert first == second
+
+    async def test_make_request_cache_key_includes_params(self, github_client):
+        """Testa que parâmetros diferentes geram entradas de cache distintas"""
+        assert github_client._cache_key("/search/users", {"q": "a", "page": 1}) == \
+            github_client._cache_key("/search/users", {"page": 1, "q": "a"})
+        assert github_client._cache_key("/search/users", {"q": "a", "page": 1}) != \
+            github_client._cache_key("/search/users", {"q": "a", "page": 2})
+
+    async def test_make_request_without_cache(self):
+        """Testa que ttl=0 ignora o cache"""
+        paths = []
+        async with _recording_client(paths) as gh:
+            await gh._make_request("/users/octocat", ttl=0)
+            await gh._make_request("/users/octocat", ttl=0)
+
+        assert paths == ["/users/octocat", "/users/octocat"]
+
+    async def test_repositories_cache_lasts_ten_minutes(self, fake_clock):
+        """Testa que a listagem de repositórios fica 10 minutos no cache em memória"""
+        paths = []
+        async with _recording_client(paths) as gh:
+            await gh.get_user_repositories("octocat")
+            fake_clock.advance(599)
+            await gh.get_user_repositories("octocat")
+            fake_clock.advance(2)
+            await gh.get_user_repositories("octocat")
+
+        assert paths == ["/users/octocat/repos", "/users/octocat/repos"]
+
+
+class TestGitHubClientConditionalRequests:
+    """Testes para revalidação do cache com ETag/If-None-Match"""
+
+    async def test_not_modified_reuses_cached_data(self, fake_clock):
+        """Testa que um 304 devolve os dados já decodificados do cache"""
+        sent_etags = []
+
+        def handler(request):
+            sent_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, content=_ROUTES["/users/octocat"], headers={**_JSON_HEADERS, "ETag": '"v1"'})
+
+        async with GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as gh:
+            first = await gh._make_request("/users/octocat")
+            fake_clock.advance(settings.cache_ttl + 1)
+            second = await gh._make_request("/users/octocat")
+            third = await gh._make_request("/users/octocat")
+
+        assert sent_etags == [None, '"v1"']
+        assert second is first
+        assert third is first
+
+    async def test_modified_response_replaces_cached_data(self, fake_clock):
+        """Testa que um 200 na revalidação substitui dados e ETag"""
+        sent_etags = []
+        versions = iter([(b'{"version": 1}', '"v1"'), (b'{"version": 2}', '"v2"')])
+
+        def handler(request):
+            sent_etags.append(request.headers.get("If-None-Match"))
+            body, etag = next(versions)
+            return httpx.Response(200, content=body, headers={**_JSON_HEADERS, "ETag": etag})
+
+        async with GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as gh:
+            assert await gh._make_request("/rate_limit") == {"version": 1}
+            fake_clock.advance(settings.cache_ttl + 1)
+            assert await gh._make_request("/rate_limit") == {"version": 2}
+
+        assert sent_etags == [None, '"v1"']
+        assert cache_service.get(gh._cache_key("/rate_limit"))["etag"] == '"v2"'
+
+    async def test_etag_is_dropped_after_etag_ttl(self, fake_clock):
+        """Testa que, passado o _ETAG_TTL, a entrada sai do cache e não há If-None-Match"""
+        sent_etags = []
+
+        def handler(request):
+            sent_etags.append(request.headers.get("If-None-Match"))
+            return httpx.Response(200, content=b"{}", headers={**_JSON_HEADERS, "ETag": '"v1"'})
+
+        async with GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as gh:
+            await gh._make_request("/rate_limit")
+            fake_clock.advance(_ETAG_TTL + 1)
+            assert cache_service.get(gh._cache_key("/rate_limit")) is None
+            await gh._make_request("/rate_limit")
+
+        assert sent_etags == [None, None]
+
+
+def _sequence_client(responses, paths):
+    """Cria um GitHubClient que devolve as respostas na ordem, registrando cada requisição"""
+    responses = iter(responses)
+
+    def handler(request):
+        paths.append(request.url.path)
+        return next(responses)
+
+    return GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+class TestGitHubClientRetries:
+    """Testes para as novas tentativas em 429/5xx e as exceções tipadas"""
+
+    @pytest.fixture(autouse=True)
+    def sleep_mock(self, monkeypatch):
+        """Elimina a espera do backoff durante os testes"""
+        mock = AsyncMock()
+        monkeypatch.setattr("app.services.github_client._sleep", mock)
+        return mock
+
+    async def test_rate_limited_then_success(self, sleep_mock):
+        """Testa que um 429 seguido de 200 gera exatamente uma nova tentativa"""
+        paths = []
+        responses = [httpx.Response(429), httpx.Response(200, content=_ROUTES["/users/octocat"], headers=_JSON_HEADERS)]
+        async with _sequence_client(responses, paths) as gh:
+            assert await gh._make_request("/users/octocat", ttl=0) == _USER_JSON
+
+        assert len(paths) == 2
+        sleep_mock.assert_awaited_once()
+
+    async def test_retry_after_header_is_respected(self, sleep_mock):
+        """Testa que o Retry-After define o tempo de espera"""
+        responses = [httpx.Response(503, headers={"Retry-After": "2"}), httpx.Response(200, content=b"{}")]
+        async with _sequence_client(responses, []) as gh:
+            await gh._make_request("/rate_limit", ttl=0)
+
+        sleep_mock.assert_awaited_once_with(2.0)
+
+    async def test_long_retry_after_raises_without_waiting(self, sleep_mock):
+        """Testa que um Retry-After acima do orçamento vira GhRateLimited sem esperar"""
+        paths = []
+        responses = [httpx.Response(429, headers={"Retry-After": "120"}), httpx.Response(200, content=b"{}")]
+        async with _sequence_client(responses, paths) as gh:
+            with pytest.raises(GhRateLimited):
+                await gh._make_request("/rate_limit", ttl=0)
+
+        assert len(paths) == 1
+        sleep_mock.assert_not_awaited()
+
+    async def test_single_attempt_is_not_retried(self, sleep_mock):
+        """Testa que max_attempts=1 devolve o erro sem esperar nem repetir"""
+        paths = []
+        async with _sequence_client([httpx.Response(503), httpx.Response(200, content=b"{}")], paths) as gh:
+            with pytest.raises(GhServerError):
+                await gh._make_request("/rate_limit", ttl=0, max_attempts=1)
+
+        assert len(paths) == 1
+        sleep_mock.assert_not_awaited()
+
+    async def test_server_error_gives_up_after_max_attempts(self, sleep_mock):
+        """Testa que 5xx persistente é tentado 5 vezes e vira GhServerError"""
+        paths = []
+        async with _sequence_client([httpx.Response(502)] * 10, paths) as gh:
+            with pytest.raises(GhServerError):
+                await gh._make_request("/rate_limit", ttl=0)
+
+        assert len(paths) == 5
+        assert sleep_mock.await_count == 4
+        assert sum(call.args[0] for call in sleep_mock.await_args_list) <= _RETRY_BUDGET
+
+    @pytest.mark.parametrize("status,headers,error_cls", [
+        (404, {}, GhNotFound),
+        (403, {"X-RateLimit-Remaining": "0"}, GhRateLimited),
+        (401, {}, httpx.HTTPStatusError),
+    ])
+    async def test_client_errors_are_not_retried(self, status, headers, error_cls, sleep_mock):
+        """Testa que erros 4xx não são repetidos e viram a exceção tipada"""
+        paths = []
+        async with _sequence_client([httpx.Response(status, headers=headers)], paths) as gh:
+            with pytest.raises(error_cls) as exc_info:
+                await gh._make_request("/rate_limit", ttl=0)
+
+        assert isinstance(exc_info.value, httpx.HTTPStatusError)
+        assert exc_info.value.response.status_code == status
+        assert len(paths) == 1
+        sleep_mock.assert_not_awaited()
+
+
+class TestGitHubClientMethods:
+    """Testes para os métodos de alto nível do cliente"""
+
+    @pytest.mark.parametrize("case", CASES, ids=lambda c: c[0])
+    async def test_get_success(self, case, github_client, mock_make_request):
+        """Testa que cada método monta a requisição e converte o payload no modelo"""
+        method, args, payload, path, params, model_cls, field, value = case
+        mock_make_request.return_value = payload
+
+        result = await getattr(github_client, method)(*args)
+        item = result[0] if isinstance(result, list) else result
+        assert isinstance(item, model_cls)
+        assert getattr(item, field) == value
+        expected_args = (path,) if params is None else (path, params)
+        mock_make_request.assert_called_once()
+        assert mock_make_request.call_args.args == expected_args
+
+    async def test_get_repository_languages_percentages(self, github_client):
+        """Testa o cálculo das porcentagens de cada linguagem"""
+        languages = await github_client.get_repository_languages("octocat", "Hello-World")
+        assert list(languages) == ["Python", "JavaScript", "HTML"]
+        assert languages["Python"].bytes == 6000
+        assert languages["Python"].percentage == pytest.approx(60.0)
+        assert languages["JavaScript"].percentage == pytest.approx(30.0)
+        assert languages["HTML"].percentage == pytest.approx(10.0)
+
+    async def test_get_repository_languages_empty(self, github_client, mock_make_request):
+        """Testa repositório sem bytes de código"""
+        mock_make_request.return_value = {"Shell": 0}
+
+        languages = await github_client.get_repository_languages("octocat", "empty")
+        assert languages["Shell"].percentage == 0.0
+
+    async def test_list_validation(self, github_client, mock_make_request):
+        """Testa que listas grandes são validadas inteiras pelo TypeAdapter"""
+        payload = [{**_REPO_JSON, "id": i, "name": f"repo-{i}"} for i in range(100)]
+        mock_make_request.return_value = payload
+
+        repos = await github_client.get_user_repositories("octocat", per_page=100)
+        assert len(repos) == 100
+        assert all(isinstance(repo, GitHubRepository) for repo in repos)
+        assert [repo.name for repo in repos] == [f"repo-{i}" for i in range(100)]
+
+    @pytest.mark.parametrize("method,args", [
+        ("get_user", ("ghost",)),
+        ("get_repository", ("octocat", "ghost")),
+    ])
+    async def test_get_not_found(self, method, args, github_client, mock_make_request):
+        """Testa que o erro 404 do GitHub é propagado pelos métodos"""
+        mock_make_request.side_effect = _NOT_FOUND_ERROR
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await getattr(github_client, method)(*args)
+        assert exc_info.value.response.status_code == 404
+
+
+class TestGitHubClientPagination:
+    """Testes para a iteração paginada dos endpoints de listagem"""
+
+    @pytest.mark.parametrize("per_page", [1, 7, 50, 100, 249, 250, 300])
+    async def test_paginate_yields_every_item_once(self, per_page):
+        """Testa que 250 itens são entregues exatamente uma vez qualquer que seja o tamanho da página"""
+        pages = []
+        async with _paginated_client(250, pages) as gh:
+            items = [item async for item in gh.paginate("/repos/octocat/Hello-World/commits", per_page=per_page)]
+
+        assert len(items) == 250
+        assert len({item["sha"] for item in items}) == 250
+        assert pages == list(range(1, -(-250 // per_page) + 1))
+
+    async def test_paginate_stops_on_empty_page(self):
+        """Testa que um endpoint sem itens encerra a iteração na primeira página"""
+        pages = []
+        async with _paginated_client(0, pages) as gh:
+            items = [item async for item in gh.paginate("/repos/octocat/Hello-World/commits")]
+
+        assert items == []
+        assert pages == [1]
+
+    async def test_iter_repository_commits_stops_early(self):
+        """Testa que interromper a iteração evita buscar as páginas seguintes"""
+        pages = []
+        async with _paginated_client(250, pages) as gh:
+            async for commit in gh.iter_repository_commits("octocat", "Hello-World"):
+                assert isinstance(commit, GitHubCommit)
+                break
+
+        assert pages == [1]
+
+
+class TestGitHubClientConcurrency:
+    """Testes para requisições concorrentes no mesmo cliente"""
+
+    async def test_concurrent_fanout(self):
+        """Testa que chamadas independentes podem ser disparadas em paralelo"""
+        paths = []
+        async with _recording_client(paths) as gh:
+            user, repos, languages, events, commits, issues, pulls = await asyncio.gather(
+                gh.get_user("octocat"),
+                gh.get_user_repositories("octocat"),
+                gh.get_repository_languages("octocat", "Hello-World"),
+                gh.get_repository_events("octocat", "Hello-World"),
+                gh.get_repository_commits("octocat", "Hello-World"),
+                gh.get_repository_issues("octocat", "Hello-World"),
+                gh.get_repository_pull_requests("octocat", "Hello-World"),
+            )
+
+        assert len(paths) == 7
+        assert set(paths) == {
+            "/users/octocat",
+            "/users/octocat/repos",
+            "/repos/octocat/Hello-World/languages",
+            "/repos/octocat/Hello-World/events",
+            "/repos/octocat/Hello-World/commits",
+            "/repos/octocat/Hello-World/issues",
+            "/repos/octocat/Hello-World/pulls",
+        }
+        assert user.login == "octocat"
+        assert repos[0].name == "Hello-World"
+        assert set(languages) == {"Python", "JavaScript", "HTML"}
+        assert events[0].type == "PushEvent"
+        assert commits[0].sha == _COMMIT_JSON["sha"]
+        assert issues[0].title == "Found a bug"
+        assert pulls[0].title == "Amazing new feature"
+
+
+class _EmptyJSONHandler(BaseHTTPRequestHandler):
+    """Responde {} a qualquer GET, mantendo a conexão aberta (keep-alive)"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class _CountingHTTPServer(ThreadingHTTPServer):
+    """Servidor HTTP que conta as conexões TCP aceitas"""
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):
+        request = super().get_request()
+        self.connections += 1
+        return request
+
+
+@pytest.fixture(scope="module")
+def local_server():
+    """Servidor HTTP local real, para exercitar o pool compartilhado"""
+    server = _CountingHTTPServer(("127.0.0.1", 0), _EmptyJSONHandler)
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestGitHubClientPooling:
+    """Testes para o compartilhamento do pool de conexões"""
+
+    def test_instances_share_http_client(self):
+        """Testa que instâncias sem cliente injetado reutilizam o mesmo pool"""
+        assert GitHubClient()._client is GitHubClient()._client
+        assert GitHubClient()._client is get_http_client()
+
+    async def test_aclose_keeps_shared_client_open(self):
+        """Testa que fechar uma instância não fecha o pool compartilhado"""
+        async with GitHubClient() as gh:
+            pass
+        assert not gh._client.is_closed
+
+    async def test_aclose_closes_injected_client(self, mock_transport):
+        """Testa que o cliente injetado é fechado junto com a instância"""
+        async with GitHubClient(http_client=httpx.AsyncClient(transport=mock_transport)) as gh:
+            pass
+        assert gh._client.is_closed
+
+    def test_shared_client_survives_event_loop_change(self, local_server):
+        """Testa chamadas seguidas a asyncio.run, cada uma com seu próprio event loop"""
+        gh = GitHubClient()
+        gh.base_url = local_server.url
+        assert asyncio.run(gh._make_request("/rate_limit", ttl=0)) == {}
+        asyncio.run(close_http_client())
+        assert asyncio.run(gh._make_request("/rate_limit", ttl=0)) == {}
+        asyncio.run(close_http_client())
+
+    async def test_shared_client_reuses_connection(self, local_server):
+        """Testa que requisições seguidas no mesmo loop usam uma única conexão"""
+        gh = GitHubClient()
+        gh.base_url = local_server.url
+        before = local_server.connections
+        await gh._make_request("/rate_limit", ttl=0)
+        await gh._make_request("/rate_limit", ttl=0)
+        assert local_server.connections - before == 1
+        await close_http_client()
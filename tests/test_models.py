@@ -0,0 +1,212 @@
+"""
+Testes dos modelos Pydantic da GitHub Data API
+"""
+
+import pytest
+from typing import List
+from pydantic import TypeAdapter, ValidationError
+from app.models.github_models import (
+    GitHubUser,
+    GitHubRepository,
+    GitHubLanguage,
+    GitHubEvent,
+    GitHubCommit,
+    GitHubIssue,
+    GitHubPullRequest,
+)
+
+
+_USER_PAYLOAD = {
+    "id": 583231,
+    "login": "octocat",
+    "name": "The Octocat",
+    "email": "octocat@github.com",
+    "avatar_url": "https://avatars.githubusercontent.com/u/583231?v=4",
+    "bio": "GitHub mascot",
+    "location": "San Francisco",
+    "company": "@github",
+    "public_repos": 8,
+    "public_gists": 8,
+    "followers": 1000,
+    "following": 9,
+    "created_at": "2011-01-25T18:44:36Z",
+    "type": "User",
+    "site_admin": False
+}
+
+_REPO_PAYLOAD = {
+    "id": 1296269,
+    "name": "Hello-World",
+    "full_name": "octocat/Hello-World",
+    "description": "My first repository on GitHub!",
+    "private": False,
+    "fork": False,
+    "language": "Python",
+    "size": 108,
+    "stargazers_count": 80,
+    "watchers_count": 80,
+    "forks_count": 9,
+    "open_issues_count": 0,
+    "default_branch": "master",
+    "topics": ["octocat", "api"],
+    "owner": _USER_PAYLOAD
+}
+
+_COMMIT_PAYLOAD = {
+    "sha": "6dcb09b5b57875f334f61aebed695e2e4193db5e",
+    "node_id": "MDY6Q29tbWl0NmRjYjA5YjViNTc4NzVmMzM0ZjYxYWViZWQ2OTVlMmU0MTkzZGI1ZQ==",
+    "commit": {"message": "Fix all the bugs"},
+    "url": "https://api.github.com/repos/octocat/Hello-World/commits/6dcb09b",
+    "html_url": "https://github.com/octocat/Hello-World/commit/6dcb09b",
+    "comments_url": "https://api.github.com/repos/octocat/Hello-World/commits/6dcb09b/comments"
+}
+
+_PULL_REQUEST_PAYLOAD = {
+    "id": 1,
+    "number": 1347,
+    "title": "Amazing new feature",
+    "state": "open",
+    "head": {"ref": "new-topic"},
+    "base": {"ref": "master"},
+    "comments_url": "https://api.github.com/repos/octocat/Hello-World/issues/1347/comments",
+    "review_comments_url": "https://api.github.com/repos/octocat/Hello-World/pulls/1347/comments",
+    "commits_url": "https://api.github.com/repos/octocat/Hello-World/pulls/1347/commits",
+    "statuses_url": "https://api.github.com/repos/octocat/Hello-World/statuses/6dcb09b"
+}
+
+_REPO_LIST_PAYLOAD = [
+    {**_REPO_PAYLOAD, "id": i, "name": f"repo-{i}", "full_name": f"octocat/repo-{i}"}
+    for i in range(1, 4)
+]
+
+# Validador de listas de repositórios
+_REPO_LIST_ADAPTER = TypeAdapter(List[GitHubRepository])
+
+# (modelo, payload, atributos esperados após a validação)
+MODELS_AND_PAYLOADS = [
+    (GitHubUser, _USER_PAYLOAD, {"login": "octocat", "followers": 1000, "site_admin": False}),
+    (GitHubRepository, _REPO_PAYLOAD, {"full_name": "octocat/Hello-World", "topics": ["octocat", "api"]}),
+    (GitHubLanguage, {"name": "Python", "bytes": 6000, "percentage": 60.0}, {"name": "Python", "bytes": 6000, "percentage": 60.0}),
+    (GitHubEvent, {"id": "1", "type": "PushEvent", "repo": {"id": 1, "name": "octocat/Hello-World"}}, {"type": "PushEvent", "public": True}),
+    (GitHubCommit, _COMMIT_PAYLOAD, {"sha": _COMMIT_PAYLOAD["sha"], "parents": []}),
+    (GitHubIssue, {"id": 1, "number": 1347, "title": "Found a bug", "state": "open"}, {"title": "Found a bug", "comments": 0}),
+    (GitHubPullRequest, _PULL_REQUEST_PAYLOAD, {"title": "Amazing new feature", "merged": False, "mergeable_state": "unknown"}),
+]
+
+# (modelo, payload com uma URL inválida, campo rejeitado)
+URL_FAIL_CASES = [
+    (GitHubCommit, {**_COMMIT_PAYLOAD, "url": "invalid-url"}, "url"),
+    (GitHubCommit, {**_COMMIT_PAYLOAD, "html_url": "not a url"}, "html_url"),
+    (GitHubPullRequest, {**_PULL_REQUEST_PAYLOAD, "commits_url": "invalid-url"}, "commits_url"),
+    (GitHubPullRequest, {**_PULL_REQUEST_PAYLOAD, "statuses_url": "ftp//missing-colon"}, "statuses_url"),
+]
+
+
+@pytest.fixture(scope="module")
+def valid_user_payload():
+    """Payload completo de usuário"""
+    return _USER_PAYLOAD
+
+
+@pytest.fixture(scope="module")
+def minimal_user_payload():
+    """Payload de usuário só com os campos obrigatórios"""
+    return {"id": 1, "login": "minimal"}
+
+
+@pytest.fixture(scope="module")
+def valid_user_model(valid_user_payload):
+    """GitHubUser validado a partir do payload completo"""
+    return GitHubUser.model_validate(valid_user_payload)
+
+
+@pytest.fixture(scope="module")
+def valid_user_dump(valid_user_model):
+    """Usuário válido serializado com model_dump"""
+    return valid_user_model.model_dump()
+
+
+@pytest.fixture(scope="module")
+def valid_repo_payload():
+    """Payload completo de repositório"""
+    return _REPO_PAYLOAD
+
+
+@pytest.fixture(scope="module")
+def valid_repo_model(valid_repo_payload):
+    """GitHubRepository validado a partir do payload completo"""
+    return GitHubRepository.model_validate(valid_repo_payload)
+
+
+@pytest.fixture(scope="module")
+def valid_repo_dump(valid_repo_model):
+    """Repositório válido serializado com model_dump"""
+    return valid_repo_model.model_dump()
+
+
+@pytest.mark.parametrize(
+    "model_cls,payload,expected",
+    MODELS_AND_PAYLOADS,
+    ids=[model_cls.__name__ for model_cls, _, _ in MODELS_AND_PAYLOADS]
+)
+def test_valid_data(model_cls, payload, expected):
+    """Testa que cada modelo aceita um payload válido e expõe os campos esperados"""
+    model = model_cls.model_validate(payload)
+    for field, value in expected.items():
+        assert getattr(model, field) == value
+
+
+@pytest.mark.parametrize("model_cls,payload,bad_field", URL_FAIL_CASES, ids=[field for _, _, field in URL_FAIL_CASES])
+def test_url_validation_fails(model_cls, payload, bad_field):
+    """Testa que URLs inválidas são rejeitadas no campo correspondente"""
+    with pytest.raises(ValidationError) as exc_info:
+        model_cls.model_validate(payload)
+    assert [error["loc"] for error in exc_info.value.errors()] == [(bad_field,)]
+
+
+class TestGitHubUser:
+    """Testes para o modelo GitHubUser"""
+
+    def test_github_user_minimal_data(self, minimal_user_payload):
+        """Testa usuário só com os campos obrigatórios"""
+        user = GitHubUser.model_validate(minimal_user_payload)
+        assert user.login == "minimal"
+        assert user.name is None
+        assert user.public_repos == 0
+        assert user.type == "User"
+        assert user.site_admin is False
+
+    def test_github_user_serialization(self, valid_user_dump):
+        """Testa a serialização do usuário"""
+        assert valid_user_dump["login"] == "octocat"
+        assert valid_user_dump["email"] == "octocat@github.com"
+        assert valid_user_dump["hireable"] is None
+
+
+class TestGitHubRepository:
+    """Testes para o modelo GitHubRepository"""
+
+    def test_github_repository_nested_owner(self, valid_repo_model):
+        """Testa que o dono do repositório é validado como GitHubUser"""
+        assert isinstance(valid_repo_model.owner, GitHubUser)
+        assert valid_repo_model.owner.login == "octocat"
+
+    def test_github_repository_minimal_data(self):
+        """Testa repositório só com os campos obrigatórios"""
+        repo = GitHubRepository.model_validate({"id": 1, "name": "repo", "full_name": "user/repo"})
+        assert repo.private is False
+        assert repo.default_branch == "main"
+        assert repo.topics == []
+        assert repo.owner is None
+
+    def test_github_repository_list_validation(self):
+        """Testa a validação de uma lista de repositórios pelo TypeAdapter"""
+        repos = _REPO_LIST_ADAPTER.validate_python(_REPO_LIST_PAYLOAD)
+        assert [repo.full_name for repo in repos] == ["octocat/repo-1", "octocat/repo-2", "octocat/repo-3"]
+        assert all(isinstance(repo.owner, GitHubUser) for repo in repos)
+
+    def test_github_repository_serialization(self, valid_repo_dump):
+        """Testa a serialização do repositório"""
+        assert valid_repo_dump["name"] == "Hello-World"
+        assert valid_repo_dump["owner"]["login"] == "octocat"
+        assert valid_repo_dump["archived"] is False
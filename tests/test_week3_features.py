@@ -0,0 +1,288 @@
+"""
+Testes das funcionalidades da semana 3: cache, logging e health check
+"""
+
+import asyncio
+import uuid
+import httpx
+import orjson
+import pytest
+from types import MappingProxyType, SimpleNamespace
+from app.config import settings
+from app.main import app
+from app.api.routes import cache_stats, clear_cache, get_github_client
+from app.services.cache_service import CacheService, cache_service
+from app.services.github_client import GitHubClient
+
+# Objeto aninhado reaproveitado pelos testes de cache
+_COMPLEX_OBJ = MappingProxyType({
+    "user": {"id": 1, "name": "Test"},
+    "repos": [{"id": 1, "name": "repo1"}],
+    "metadata": {"timestamp": "2023-01-01"}
+})
+
+# Resposta simulada do GitHub para GET /users/testuser, pré-serializada
+_MOCK_USER_RESPONSE = MappingProxyType({
+    "id": 1,
+    "login": "testuser",
+    "name": "Test User",
+    "public_repos": 2,
+    "followers": 5,
+    "following": 3,
+    "type": "User",
+    "site_admin": False
+})
+_MOCK_USER_BODY = orjson.dumps(dict(_MOCK_USER_RESPONSE))
+
+# Chaves e headers esperados, verificados com um único teste de subconjunto
+_HEALTH_KEYS = frozenset({"status", "message", "version", "timestamp", "cache", "environment", "github_api"})
+_CACHE_STATS_KEYS = frozenset({"memory_cache_size", "memory_cache_maxsize", "use_redis", "redis_connected"})
+_PERF_HEADERS = frozenset({"x-request-id", "x-response-time"})
+
+# Operação aplicada sobre "test_key" já armazenada -> valor esperado depois dela
+_CACHE_OPS = {
+    "set_get": (lambda c: c.set("test_key", "test_value"), "test_value"),
+    "delete": (lambda c: c.delete("test_key"), None),
+    "clear": (lambda c: c.clear(), None),
+}
+
+
+@pytest.fixture(scope="module")
+def cache():
+    """CacheService único para o módulo"""
+    c = CacheService()
+    yield c
+    c.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset(cache):
+    """Esvazia o cache compartilhado antes de cada teste"""
+    cache.clear()
+    yield
+
+
+def _ok_json(response):
+    """Verifica o status 200 e decodifica o corpo com orjson"""
+    assert response.status_code == 200
+    return orjson.loads(response.content)
+
+
+async def _stats_from_service(client):
+    return cache_service.get_stats()
+
+
+async def _stats_from_handler(client):
+    return await cache_stats()
+
+
+async def _stats_from_endpoint(client):
+    return _ok_json(await client.get("/api/v1/cache/stats"))
+
+
+# Fontes das estatísticas do cache global, do serviço até a rota HTTP
+_STATS_SOURCES = {
+    "service": _stats_from_service,
+    "handler": _stats_from_handler,
+    "endpoint": _stats_from_endpoint,
+}
+
+
+@pytest.fixture(scope="session")
+def redis_available():
+    """Indica se há um Redis acessível nas configurações atuais"""
+    redis = pytest.importorskip("redis")
+    from redis.backoff import NoBackoff
+    from redis.retry import Retry
+
+    # Sem novas tentativas: com o Redis fora do ar a sonda falha na hora
+    probe = redis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        socket_connect_timeout=0.5,
+        retry=Retry(NoBackoff(), 0)
+    )
+    try:
+        return probe.ping()
+    except redis.exceptions.RedisError:
+        return False
+
+
+@pytest.fixture
+def global_cache():
+    """Cache global usado pelo GitHubClient e pelas rotas, isolado por teste"""
+    cache_service.clear()
+    yield cache_service
+    cache_service.clear()
+
+
+@pytest.fixture(scope="module")
+def health_response(client):
+    """Resposta do health check com a consulta ao GitHub simulada"""
+    async def rate_limit(self, endpoint, params=None, ttl=0, max_attempts=None):
+        # O health check não pode esperar por novas tentativas
+        assert max_attempts == 1
+        return {}
+
+    # O health check consulta /rate_limit no GitHub; aqui a chamada é simulada
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GitHubClient, "_make_request", rate_limit)
+        return asyncio.run(client.get("/api/v1/health"))
+
+
+@pytest.fixture(scope="module")
+def health_data(health_response):
+    """Corpo JSON do health check, após verificar o status 200"""
+    return _ok_json(health_response)
+
+
+class TestCacheService:
+    """Testes para o serviço de cache"""
+
+    def test_cache_service_initialization(self):
+        """Testa a criação do serviço com cache em memória"""
+        c = CacheService()
+        assert c.memory_cache.maxsize == 1000
+        assert c.use_redis is False
+        assert c.redis_client is None
+
+    @pytest.mark.parametrize("op", list(_CACHE_OPS))
+    def test_cache_operation(self, cache, op):
+        """Testa set/get, delete e clear sobre uma chave armazenada"""
+        apply, expected = _CACHE_OPS[op]
+        cache.set("test_key", "test_value")
+        assert apply(cache) is True
+        assert cache.get("test_key") == expected
+
+    def test_cache_with_complex_objects(self, cache):
+        """Testa armazenar objetos aninhados"""
+        cache.set("complex_key", _COMPLEX_OBJ)
+        assert cache.get("complex_key") == _COMPLEX_OBJ
+
+    def test_get_or_set(self, cache):
+        """Testa que a função padrão só é chamada quando a chave não existe"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "computed"
+
+        assert cache.get_or_set("lazy_key", compute) == "computed"
+        assert cache.get_or_set("lazy_key", compute) == "computed"
+        assert len(calls) == 1
+
+
+class TestEnhancedHealthCheck:
+    """Testes para o health check detalhado"""
+
+    def test_health_check_with_cache_info(self, health_data):
+        """Testa que o health check inclui as informações do cache"""
+        assert health_data["status"] == "healthy"
+        assert health_data["github_api"] == "connected"
+        assert _HEALTH_KEYS <= health_data.keys()
+        assert _CACHE_STATS_KEYS <= health_data["cache"].keys()
+
+    def test_health_check_headers(self, health_response):
+        """Testa os headers de performance do health check"""
+        assert _PERF_HEADERS <= health_response.headers.keys()
+        assert float(health_response.headers["X-Response-Time"]) >= 0
+
+
+class TestLoggingMiddleware:
+    """Testes para o middleware de logging"""
+
+    def test_request_logging_headers(self, health_response):
+        """Testa que o middleware adiciona os headers de rastreamento"""
+        assert health_response.headers["content-type"] == "application/json"
+        assert _PERF_HEADERS <= health_response.headers.keys()
+
+    async def test_request_id_is_uuid4(self, client):
+        """Testa que cada resposta traz um X-Request-ID no formato UUID4"""
+        response = await client.get("/")
+        request_id = response.headers["X-Request-ID"]
+        assert str(uuid.UUID(request_id, version=4)) == request_id
+
+    async def test_request_id_comes_from_uuid4_per_request(self, client, monkeypatch):
+        """Testa que o middleware gera um novo uuid4 a cada requisição e o devolve no header"""
+        ids = [uuid.UUID(int=1, version=4), uuid.UUID(int=2, version=4)]
+        monkeypatch.setattr("app.main.uuid", SimpleNamespace(uuid4=iter(ids).__next__))
+        response1 = await client.get("/")
+        response2 = await client.get("/")
+        assert response1.headers["X-Request-ID"] == str(ids[0])
+        assert response2.headers["X-Request-ID"] == str(ids[1])
+
+
+@pytest.mark.xdist_group(name="cache_global")
+class TestCacheEndpoints:
+    """Testes para as rotas de cache; os handlers são chamados diretamente"""
+
+    @pytest.mark.parametrize("source", list(_STATS_SOURCES))
+    async def test_cache_stats(self, client, global_cache, source):
+        """Testa as estatísticas do cache global pelo serviço, pelo handler e pela rota"""
+        global_cache.set("test_key", "test_value")
+        stats = await _STATS_SOURCES[source](client)
+        assert _CACHE_STATS_KEYS <= stats.keys()
+        assert stats["memory_cache_size"] == 1
+        assert stats["memory_cache_maxsize"] == 1000
+
+    async def test_clear_cache_handler(self, global_cache):
+        """Testa que o handler esvazia o cache global"""
+        global_cache.set("test_key", "test_value")
+        data = await clear_cache()
+        assert data == {"success": True, "message": "Cache limpo com sucesso"}
+        assert global_cache.get("test_key") is None
+
+
+@pytest.mark.xdist_group(name="cache_global")
+class TestCacheIntegration:
+    """Testes de integração entre os endpoints e o cache global"""
+
+    async def test_user_endpoint_with_cache(self, client, global_cache):
+        """Testa que a segunda requisição ao mesmo usuário não chega ao GitHub"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, content=_MOCK_USER_BODY)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        app.dependency_overrides[get_github_client] = lambda: GitHubClient(http_client=http_client)
+        try:
+            response1 = await client.get("/api/v1/users/testuser")
+            response2 = await client.get("/api/v1/users/testuser")
+        finally:
+            app.dependency_overrides.pop(get_github_client, None)
+            await http_client.aclose()
+
+        assert _ok_json(response1)["login"] == "testuser"
+        assert response2.status_code == 200
+        assert response2.content == response1.content
+        assert calls == ["/users/testuser"]
+        # O acerto é verificado pela entrada no cache, não pelo X-Response-Time
+        cached = global_cache.get(GitHubClient._cache_key("/users/testuser"))
+        assert cached["data"] == _MOCK_USER_RESPONSE
+
+
+@pytest.mark.integration
+class TestRedisCache:
+    """Testes do caminho Redis, executados apenas com um Redis acessível"""
+
+    def test_redis_roundtrip(self, redis_available):
+        """Testa set/get/delete através do Redis"""
+        if not redis_available:
+            pytest.skip("Redis não disponível")
+        c = CacheService()
+        c.use_redis = True
+        c._init_redis()
+        assert c.set("test:week3:redis", _COMPLEX_OBJ["user"], ttl=10)
+        assert c.get("test:week3:redis") == _COMPLEX_OBJ["user"]
+        assert c.delete("test:week3:redis") is True
+
+
+class TestErrorHandling:
+    """Testes para entradas inválidas no cache"""
+
+    def test_invalid_cache_key(self, cache):
+        """Testa o contrato para chave None: leitura vazia e escrita aceita"""
+        assert cache.get(None) is None
+        assert cache.set(None, "value") is True